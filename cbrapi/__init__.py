@@ -1,12 +1,24 @@
 from importlib.metadata import version
 
 
-from cbrapi.cbr_settings import make_cbr_client
+from cbrapi.cbr_settings import (
+    make_cbr_client,
+    call_service,
+    configure_client_pool,
+)
+from cbrapi.cache import enable_response_cache, disable_response_cache
+from cbrapi.serving import (
+    enable_stale_while_revalidate,
+    disable_stale_while_revalidate,
+)
+from cbrapi.hedging import enable_request_hedging, disable_request_hedging
+from cbrapi.results import enable_result_cache, disable_result_cache
 from cbrapi.currency import get_currencies_list, get_currency_code, get_time_series
 from cbrapi.helpers import (
     pad_missing_periods,
     calculate_inverse_rate,
     normalize_data,
+    long_to_wide,
     guess_date,
     check_ticker_code,
     check_symbol_ts,
@@ -17,9 +29,20 @@ from cbrapi.ruonia import (
     get_ruonia_overnight,
     get_roisfix,
 )
-from cbrapi.rates import get_key_rate, get_ibor
+from cbrapi.rates import (
+    get_key_rate,
+    get_ibor,
+    get_deposit_rates,
+    get_repo_debt,
+)
+from cbrapi.endpoints import Endpoint, ENDPOINTS, register_endpoint, fetch_endpoint
 from cbrapi.metals import get_metals_prices
 from cbrapi.reserves import get_mrrf
+from cbrapi.parsing import enable_process_parsing, disable_process_parsing
+from cbrapi.views import SeriesViews, get_series_views, clear_series_views
+from cbrapi.vintage import VintageStore, enable_vintage_store, disable_vintage_store
+from cbrapi.profiling import profile
+from cbrapi.prefetch import Prefetcher, PrefetchJob
 
 
 __version__ = version("cbrapi")
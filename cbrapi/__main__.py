@@ -0,0 +1,4 @@
+from cbrapi.cli import main
+
+
+raise SystemExit(main())
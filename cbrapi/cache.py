@@ -0,0 +1,302 @@
+import gzip
+import hashlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional, gzip is always available
+    zstandard = None
+
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "cbrapi"
+    / "responses"
+)
+
+# Seconds to keep a reply of an operation whose date window is not closed yet.
+DEFAULT_TTL = {
+    "EnumValutesXML": 24 * 60 * 60,
+}
+DEFAULT_OPERATION_TTL = 60 * 60
+
+_response_cache = None
+_refreshing = ContextVar("cbrapi_refreshing", default=False)
+_refresh_expires = ContextVar("cbrapi_refresh_expires", default=None)
+
+
+def last_business_day(today: Optional[date] = None) -> date:
+    """
+    Return the last weekday before today.
+    """
+    day = (today or date.today()) - timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
+
+
+def _arg_key(arg) -> str:
+    if isinstance(arg, (datetime, date)):
+        return arg.isoformat()
+    return repr(arg)
+
+
+def make_key(operation: str, args: tuple) -> str:
+    """
+    Hash an operation name and its arguments into a cache key.
+    """
+    raw = "|".join([operation] + [_arg_key(arg) for arg in args])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def is_immutable(args: tuple, today: Optional[date] = None) -> bool:
+    """
+    Check if the date window of a request ends before the last business day.
+
+    Such windows are not revised by CBR and can be cached forever.
+    """
+    dates = [
+        arg.date() if isinstance(arg, datetime) else arg
+        for arg in args
+        if isinstance(arg, (datetime, date))
+    ]
+    return bool(dates) and max(dates) < last_business_day(today)
+
+
+class ResponseCache:
+    """
+    Compressed content-addressed disk cache of raw SOAP replies.
+
+    Replies are stored under a hash of (operation, arguments). Entries expire
+    after a TTL set per operation, except for closed historical windows which
+    never expire. The total size on disk is bounded with LRU eviction.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path, None] = None,
+        max_bytes: int = 512 * 1024 * 1024,
+        ttl: Optional[dict] = None,
+        default_ttl: float = DEFAULT_OPERATION_TTL,
+        compression: str = "auto",
+    ):
+        if compression == "auto":
+            compression = "zstd" if zstandard is not None else "gzip"
+        if compression not in ("zstd", "gzip"):
+            raise ValueError("compression must be 'auto', 'zstd' or 'gzip'.")
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstd compression requires the 'zstandard' package.")
+        self.directory = Path(directory or DEFAULT_CACHE_DIR)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl = {**DEFAULT_TTL, **(ttl or {})}
+        self.default_ttl = default_ttl
+        self.compression = compression
+        self._lock = threading.Lock()
+        self._total_bytes = sum(path.stat().st_size for path in self._entries())
+
+    def _entries(self):
+        yield from self.directory.glob("*/*.xml.gz")
+        yield from self.directory.glob("*/*.xml.zst")
+
+    def _path(self, key: str) -> Path:
+        suffix = "zst" if self.compression == "zstd" else "gz"
+        return self.directory / key[:2] / f"{key}.xml.{suffix}"
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor().compress(data)
+        return gzip.compress(data)
+
+    def _decompress(self, path: Path, data: bytes) -> bytes:
+        if path.suffix == ".zst":
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def get(self, operation: str, args: tuple):
+        """
+        Return a cached reply or None if it is missing or expired.
+        """
+        path = self._path(make_key(operation, args))
+        try:
+            blob = self._decompress(path, path.read_bytes())
+        except (FileNotFoundError, OSError, EOFError):
+            return None
+        header, _, payload = blob.partition(b"\n")
+        created, immutable, kind, *expires = header.decode("ascii").split()
+        if immutable == "0":
+            if expires:
+                if time.time() > float(expires[0]):
+                    return None
+            elif time.time() - float(created) > self.ttl.get(
+                operation, self.default_ttl
+            ):
+                return None
+        os.utime(path)  # mark as recently used
+        return payload.decode("utf-8") if kind == "str" else payload
+
+    def put(
+        self,
+        operation: str,
+        args: tuple,
+        reply: Union[bytes, str],
+        expires: Optional[float] = None,
+    ):
+        """
+        Store a reply.
+
+        expires is a Unix time until which the reply is valid, overriding the TTL.
+        """
+        kind = "str" if isinstance(reply, str) else "bytes"
+        payload = reply.encode("utf-8") if kind == "str" else reply
+        immutable = int(is_immutable(args))
+        header = f"{time.time():.0f} {immutable} {kind}"
+        if expires is not None:
+            header += f" {expires:.0f}"
+        header = f"{header}\n".encode("ascii")
+        data = self._compress(header + payload)
+
+        path = self._path(make_key(operation, args))
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_bytes(data)
+        with self._lock:
+            old_size = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+            self._total_bytes += len(data) - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """
+        Remove least recently used entries until the cache fits max_bytes.
+        """
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._total_bytes = total
+
+    def get_or_fetch(self, operation: str, args: tuple, fetch: Callable):
+        """
+        Return a cached reply or call fetch() and cache its result.
+        """
+        reply = None if is_refreshing() else self.get(operation, args)
+        if reply is None:
+            reply = fetch()
+            self.put(operation, args, reply, _refresh_expires.get())
+        return reply
+
+    def clear(self):
+        """
+        Remove all cached replies.
+        """
+        with self._lock:
+            for path in self._entries():
+                path.unlink(missing_ok=True)
+            self._total_bytes = 0
+
+
+@contextmanager
+def refresh_responses(expires: Optional[datetime] = None):
+    """
+    Fetch replies from CBR inside the block and overwrite the cached ones.
+
+    If expires is given, the new replies stay valid until that time instead of
+    their TTL (e.g., until the next publication window).
+    """
+    token = _refreshing.set(True)
+    expires_token = _refresh_expires.set(expires and expires.timestamp())
+    try:
+        yield
+    finally:
+        _refresh_expires.reset(expires_token)
+        _refreshing.reset(token)
+
+
+def is_refreshing() -> bool:
+    """
+    Check if cached replies are being refreshed in the current context.
+    """
+    return _refreshing.get()
+
+
+def enable_response_cache(
+    directory: Union[str, Path, None] = None,
+    max_bytes: int = 512 * 1024 * 1024,
+    ttl: Optional[dict] = None,
+    default_ttl: float = DEFAULT_OPERATION_TTL,
+    compression: str = "auto",
+) -> ResponseCache:
+    """
+    Cache raw CBR replies on local disk for all get_* functions.
+
+    Parameters
+    ----------
+    directory : str or Path, optional
+        Cache directory. Defaults to '~/.cache/cbrapi/responses'.
+
+    max_bytes : int, default 512 MiB
+        Size limit of the compressed replies. Least recently used replies are evicted first.
+
+    ttl : dict, optional
+        Time to live in seconds per DailyInfo operation (e.g., {'KeyRate': 600}).
+
+    default_ttl : float, default 3600
+        Time to live in seconds for operations not listed in ttl.
+
+    compression : {'auto', 'zstd', 'gzip'}, default 'auto'
+        'auto' uses zstd if the 'zstandard' package is installed and gzip otherwise.
+
+    Returns
+    -------
+    ResponseCache
+        The cache in use.
+
+    Notes
+    -----
+    Requests with a date window that ends before the last business day never expire.
+
+    Examples
+    --------
+    >>> enable_response_cache(max_bytes=100 * 1024 * 1024, ttl={'KeyRate': 600})
+    """
+    global _response_cache
+    _response_cache = ResponseCache(
+        directory, max_bytes, ttl, default_ttl, compression
+    )
+    return _response_cache
+
+
+def disable_response_cache():
+    """
+    Stop caching raw CBR replies. Cached files are kept on disk.
+    """
+    global _response_cache
+    _response_cache = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Return the response cache in use or None if it is disabled.
+    """
+    return _response_cache
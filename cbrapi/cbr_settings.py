@@ -1,6 +1,22 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import copy_context
+from typing import Callable, Optional
+
 from suds.client import Client
 from suds.xsd.doctor import Import, ImportDoctor
 
+from cbrapi.cache import (
+    get_response_cache,
+    is_refreshing,
+    make_key,
+    refresh_responses,
+)
+from cbrapi.hedging import get_hedging_policy
+from cbrapi.serving import get_stale_while_revalidate
+
 
 def make_cbr_client():
     imp = Import("http://www.w3.org/2001/XMLSchema")  # the schema to import
@@ -12,3 +28,164 @@ def make_cbr_client():
         retxml=True,
         headers={"User-Agent": "Mozilla"},
     )
+
+
+class ClientPool:
+    """
+    Bounded pool of CBR clients for use from many threads.
+
+    suds clients hold per-request state and must not be shared between threads.
+    The WSDL is parsed once; pooled clients are clones sharing it.
+    A client is dropped if a call through it raised or if it stayed idle longer than max_idle.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 8,
+        max_idle: float = 300,
+        factory: Callable = make_cbr_client,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size should be at least 1.")
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.factory = factory
+        self._prototype = None
+        self._idle = queue.LifoQueue()  # (client, returned_at)
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+
+    def _new_client(self):
+        with self._lock:
+            if self._prototype is None:
+                self._prototype = self.factory()
+        return self._prototype.clone()
+
+    def _checkout(self):
+        while True:
+            try:
+                cbr_client, returned_at = self._idle.get_nowait()
+            except queue.Empty:
+                return self._new_client()
+            if time.monotonic() - returned_at <= self.max_idle:
+                return cbr_client
+
+    @contextmanager
+    def client(self, timeout: Optional[float] = None):
+        """
+        Check out a client for the duration of the block.
+
+        Waits up to timeout seconds for a free client if the pool is exhausted.
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("No CBR client available in the pool.")
+        try:
+            cbr_client = self._checkout()
+            healthy = False
+            try:
+                yield cbr_client
+                healthy = True
+            finally:
+                if healthy:
+                    self._idle.put((cbr_client, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    def clear(self):
+        """
+        Drop idle clients and the parsed WSDL.
+        """
+        with self._lock:
+            self._prototype = None
+            self._idle = queue.LifoQueue()
+
+
+_client_pool = ClientPool()
+
+
+def configure_client_pool(max_size: int = 8, max_idle: float = 300) -> ClientPool:
+    """
+    Replace the pool of CBR clients used by all get_* functions.
+
+    Parameters
+    ----------
+    max_size : int, default 8
+        Maximum number of clients in use at the same time. Other calls wait for a free client.
+
+    max_idle : float, default 300
+        Seconds after which an idle client is dropped instead of being reused.
+
+    Returns
+    -------
+    ClientPool
+        The pool in use.
+
+    Examples
+    --------
+    >>> configure_client_pool(max_size=16)
+    """
+    global _client_pool
+    _client_pool = ClientPool(max_size, max_idle)
+    return _client_pool
+
+
+def _call(
+    operation: str,
+    args: tuple,
+    timeout: Optional[float] = None,
+    started: Optional[Callable] = None,
+):
+    with _client_pool.client(timeout) as cbr_client:
+        if started is not None:
+            started()
+        return getattr(cbr_client.service, operation)(*args)
+
+
+def _request(operation: str, args: tuple):
+    policy = get_hedging_policy()
+    if policy is None or not policy.applies(operation):
+        return _call(operation, args)
+    # a duplicate request does not wait for a client if the pool is exhausted
+    return policy.call(
+        operation,
+        lambda hedge, started: _call(
+            operation, args, 0 if hedge else None, started
+        ),
+    )
+
+
+def _fetch(operation: str, args: tuple):
+    cache = get_response_cache()
+    if cache is None:
+        return _request(operation, args)
+    return cache.get_or_fetch(operation, args, lambda: _request(operation, args))
+
+
+def _refetch(operation: str, args: tuple):
+    with refresh_responses():
+        return _fetch(operation, args)
+
+
+def call_service(operation: str, *args):
+    """
+    Call a DailyInfo web service operation and return the raw SOAP reply.
+
+    The reply is taken from the stale-while-revalidate store and the response cache
+    if they are enabled. Revalidations of the store skip the response cache and
+    overwrite its entry, so max_age bounds the age of served replies.
+    """
+    swr = get_stale_while_revalidate()
+    if swr is None:
+        return _fetch(operation, args)
+    key = make_key(operation, args)
+    if is_refreshing():
+        # the refresh flag must reach the thread that runs the request
+        context = copy_context()
+        return swr.revalidate(
+            key, lambda: context.run(_fetch, operation, args)
+        ).result()
+    return swr.get(
+        key,
+        lambda: _fetch(operation, args),
+        refresh=lambda: _refetch(operation, args),
+    )
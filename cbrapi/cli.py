@@ -0,0 +1,287 @@
+import argparse
+import importlib.util
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from cbrapi.cache import enable_response_cache
+from cbrapi.currency import get_time_series
+from cbrapi.endpoints import ENDPOINTS, fetch_endpoint
+from cbrapi.helpers import guess_date
+from cbrapi import prefetch
+
+
+FORMATS = {"parquet": "parquet", "csv": "csv"}
+
+# extra days fetched around a year window, so padding at its edges uses the
+# neighbouring years' values like a single fetch of the whole range does
+LOOKBACK = timedelta(days=62)
+
+COVERAGE_SUFFIX = ".covered.json"
+
+
+def check_format(fmt: str) -> str:
+    """
+    Check that the output format can be written before any request is made.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"format should be one of {tuple(FORMATS)}, got '{fmt}'.")
+    if fmt == "parquet" and not any(
+        importlib.util.find_spec(engine) for engine in ("pyarrow", "fastparquet")
+    ):
+        raise ImportError(
+            "--format parquet requires the 'pyarrow' package "
+            "(pip install 'cbrapi[parquet]'), or use --format csv."
+        )
+    return fmt
+
+
+def year_windows(first_date: date, last_date: date) -> list:
+    """
+    Split a date range into calendar year windows.
+    """
+    return [
+        (max(first_date, date(year, 1, 1)), min(last_date, date(year, 12, 31)))
+        for year in range(first_date.year, last_date.year + 1)
+    ]
+
+
+def partition_path(out_dir: Path, symbol: str, year: int, fmt: str) -> Path:
+    return out_dir / symbol / f"year={year}" / f"data.{FORMATS[fmt]}"
+
+
+def coverage_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}{COVERAGE_SUFFIX}")
+
+
+def is_covered(path: Path, window, period, fmt: str) -> bool:
+    """
+    Check if the partition file was written for the whole window with the same
+    period and format.
+    """
+    try:
+        coverage = json.loads(coverage_path(path).read_text())
+    except (OSError, ValueError):
+        return False
+    return (
+        coverage.get("format") == fmt
+        and coverage.get("period") == period
+        and coverage.get("first_date", "9999") <= str(window[0])
+        and coverage.get("last_date", "") >= str(window[1])
+        and (coverage.get("rows") == 0 or path.exists())
+    )
+
+
+def write_coverage(path: Path, window, period, fmt: str, rows: int):
+    """
+    Record the window of a written partition next to its file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    coverage = {
+        "first_date": str(window[0]),
+        "last_date": str(window[1]),
+        "period": period,
+        "format": fmt,
+        "rows": rows,
+    }
+    tmp_path = coverage_path(path).with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(coverage))
+    os.replace(tmp_path, coverage_path(path))
+
+
+def fetch_symbol(symbol: str, first_date: date, last_date: date, period=None):
+    """
+    Fetch a registered endpoint (e.g., 'KEY_RATE') or a currency (e.g., 'USD').
+    """
+    if symbol in ENDPOINTS:
+        return fetch_endpoint(symbol, str(first_date), str(last_date), period)
+    return get_time_series(symbol, str(first_date), str(last_date), period or "D")
+
+
+def trim_window(data, window):
+    """
+    Keep the periods of a get_* result that overlap the window.
+    """
+    if data.empty:
+        return data
+    first, last = pd.Timestamp(window[0]), pd.Timestamp(window[1])
+    index = data.index
+    if isinstance(index, pd.DatetimeIndex) and index.freq is not None:
+        index = index.to_period()  # e.g., month ends of monthly currency rates
+    if isinstance(index, pd.PeriodIndex):
+        return data[(index.end_time >= first) & (index.start_time <= last)]
+    return data[(index >= first) & (index <= last)]
+
+
+def to_table(data) -> pd.DataFrame:
+    """
+    Convert a get_* result to a flat table with a 'date' column.
+    """
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+    if isinstance(data.index, pd.PeriodIndex):
+        data = data.to_timestamp()
+    if isinstance(data.columns, pd.MultiIndex):
+        data.columns = ["_".join(str(level) for level in col) for col in data.columns]
+    return data.rename_axis("date").reset_index()
+
+
+def write_table(table: pd.DataFrame, path: Path, fmt: str):
+    """
+    Write a partition atomically, so an existing file is always complete.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    if fmt == "parquet":
+        table.to_parquet(tmp_path, index=False)
+    else:
+        table.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def export_partition(symbol, window, out_dir, fmt, period, bounds=None):
+    """
+    Fetch a year window with LOOKBACK days around it, trim it and write it.
+
+    bounds is the (first_date, last_date) range of the whole export; the extra
+    days are not fetched beyond it.
+    """
+    first_date, last_date = window
+    fetch_first, fetch_last = bounds or window
+    fetch_first = max(fetch_first, first_date - LOOKBACK)
+    fetch_last = min(fetch_last, last_date + LOOKBACK)
+    data = fetch_symbol(symbol, fetch_first, fetch_last, period)
+    table = to_table(trim_window(data, window))
+    path = partition_path(out_dir, symbol, first_date.year, fmt)
+    if not table.empty:
+        write_table(table, path, fmt)
+    elif path.exists():
+        path.unlink()  # left from an export of another range
+    write_coverage(path, window, period, fmt, len(table))
+    return len(table)
+
+
+def export(
+    symbols,
+    first_date: date,
+    last_date: date,
+    out_dir: Path,
+    fmt: str = "parquet",
+    jobs: int = 4,
+    period=None,
+    stream=sys.stderr,
+) -> int:
+    """
+    Fetch symbols concurrently and write one file per symbol and year.
+
+    Each year is fetched with LOOKBACK days around it, so partitions hold the same
+    values as a single fetch of the whole range. A '.data.<format>.covered.json' file
+    next to each partition records its window, period and format. Partitions of years
+    that ended before today are skipped if their file exists and covers the requested
+    window, so an interrupted export resumes where it stopped. Returns the number
+    of failures.
+    """
+    check_format(fmt)
+    today = date.today()
+    tasks = []
+    for symbol in symbols:
+        for window in year_windows(first_date, last_date):
+            path = partition_path(out_dir, symbol, window[0].year, fmt)
+            if window[1] < today and is_covered(path, window, period, fmt):
+                continue
+            tasks.append((symbol, window))
+
+    failures = 0
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {}
+        for symbol, window in tasks:
+            future = executor.submit(
+                export_partition,
+                symbol,
+                window,
+                out_dir,
+                fmt,
+                period,
+                (first_date, last_date),
+            )
+            futures[future] = (symbol, window)
+        for future in as_completed(futures):
+            symbol, (start, end) = futures[future]
+            try:
+                rows = future.result()
+            except Exception as e:
+                failures += 1
+                stream.write(f"{symbol} {start}..{end}: failed: {e!r}\n")
+            else:
+                stream.write(f"{symbol} {start}..{end}: {rows} rows\n")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="cbrapi", description="Command line interface to the CBR web services."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser(
+        "export", help="export time series to partitioned Parquet or CSV files"
+    )
+    export_parser.add_argument(
+        "--symbols",
+        nargs="+",
+        required=True,
+        help=f"currency tickers (e.g. USD) or endpoints: {', '.join(ENDPOINTS)}",
+    )
+    export_parser.add_argument(
+        "--from", dest="first_date", required=True, help="YYYY-MM-DD or YYYY-MM"
+    )
+    export_parser.add_argument(
+        "--to", dest="last_date", help="YYYY-MM-DD or YYYY-MM, defaults to today"
+    )
+    export_parser.add_argument("--format", choices=FORMATS, default="parquet")
+    export_parser.add_argument(
+        "--out", default="cbrapi_export", help="output directory"
+    )
+    export_parser.add_argument("--jobs", type=int, default=4, help="parallel requests")
+    export_parser.add_argument("--period", choices=["D", "M"], help="data periodicity")
+    export_parser.add_argument("--cache-dir", help="enable the response cache in DIR")
+
+    commands.add_parser(
+        "prefetch",
+        help="refresh the response cache after CBR publications",
+        add_help=False,
+    )
+
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["prefetch"]:
+        return prefetch.main(argv[1:])
+    options = parser.parse_args(argv)
+    try:
+        check_format(options.format)
+    except ImportError as e:
+        parser.error(str(e))
+
+    if options.cache_dir:
+        enable_response_cache(options.cache_dir)
+    first_date = guess_date(options.first_date, options.first_date).date()
+    last_date = guess_date(options.last_date, default_value=str(date.today())).date()
+    failures = export(
+        [symbol.upper() for symbol in options.symbols],
+        first_date,
+        last_date,
+        Path(options.out),
+        options.format,
+        options.jobs,
+        options.period,
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,12 +1,20 @@
 import re
-from datetime import datetime, date
+from datetime import date
 
+import numpy as np
 import pandas as pd
 
-from cbrapi.cbr_settings import make_cbr_client
+from cbrapi.cbr_settings import call_service
+from cbrapi.parsing import parse_xml, parse_columns
+from cbrapi.results import cached_result
 from cbrapi.helpers import (
     pad_missing_periods,
     calculate_inverse_rate,
+    arrays_to_output,
+    check_output,
+    check_days,
+    parse_date,
+    empty_output,
     check_ticker_code,
     check_symbol_ts,
 )
@@ -15,6 +23,7 @@ from cbrapi.helpers import (
 today = date.today()
 
 
+@cached_result
 def get_currencies_list() -> pd.DataFrame:
     """
     Get a list of available currencies from CBR.
@@ -36,14 +45,13 @@ def get_currencies_list() -> pd.DataFrame:
     --------
     >>> get_currencies_list()
     """
-    cbr_client = make_cbr_client()
     # get currency table with DAILY time series
-    currencies_daily_xml = cbr_client.service.EnumValutesXML(False)
-    df_daily = pd.read_xml(currencies_daily_xml, xpath="//EnumValutes")
+    currencies_daily_xml = call_service("EnumValutesXML", False)
+    df_daily = parse_xml(currencies_daily_xml, xpath="//EnumValutes")
 
     # get currency table with MONTHLY time series
-    currencies_monthly_xml = cbr_client.service.EnumValutesXML(True)
-    df_monthly = pd.read_xml(currencies_monthly_xml, xpath="//EnumValutes")
+    currencies_monthly_xml = call_service("EnumValutesXML", True)
+    df_monthly = parse_xml(currencies_monthly_xml, xpath="//EnumValutes")
     return pd.concat([df_daily, df_monthly], axis=0, join="outer", copy="false")
 
 
@@ -92,8 +100,14 @@ def get_currency_code(ticker: str) -> str:
     return code
 
 
+@cached_result
 def get_time_series(
-    symbol: str, first_date: str, last_date: str, period: str = "D"
+    symbol: str,
+    first_date: str,
+    last_date: str,
+    period: str = "D",
+    output: str = "pandas",
+    days: str = "calendar",
 ) -> pd.Series:
     """
     Get currency rate historical data from CBR.
@@ -112,6 +126,17 @@ def get_time_series(
     period: {'D', 'M'}, default 'D'
         Data periodicity. Currently daily ('D') and monthly ('M') frequencies are supported.
 
+    output : {'pandas', 'numpy', 'arrow', 'polars'}, default 'pandas'
+        Result type. 'numpy' returns a (dates, values) pair of arrays, where dates are
+        int64 day ordinals since 1970-01-01 (month ordinals for monthly data).
+        'arrow' returns a pyarrow.Table with a 'date' column.
+        Both skip building the pandas index and pad the raw arrays.
+        'polars' returns a polars.DataFrame with a 'date' column.
+
+    days : {'calendar', 'business'}, default 'calendar'
+        Pad daily data to every calendar day or to weekdays only (about 30% fewer rows).
+        Rates set on Saturday are carried to Monday.
+
     Returns
     -------
     pd.Series
@@ -136,12 +161,10 @@ def get_time_series(
     >>> get_time_series('USD', '2023-01-01', '2023-12-31', 'D')
     >>> get_time_series('EUR', '2023-01', '2023-12', 'M')
     """
-    try:
-        data1 = datetime.strptime(first_date, "%Y-%m-%d")
-        data2 = datetime.strptime(last_date, "%Y-%m-%d")
-    except ValueError:
-        data1 = datetime.strptime(first_date, "%Y-%m")
-        data2 = datetime.strptime(last_date, "%Y-%m")
+    check_output(output)
+    check_days(days)
+    data1 = parse_date(first_date)
+    data2 = parse_date(last_date)
     symbol = symbol.upper()
 
     if re.match("RUB", symbol):
@@ -156,33 +179,44 @@ def get_time_series(
     check_symbol_ts(symbol, symbol_col)
 
     code = get_currency_code(query_symbol)
-    cbr_client = make_cbr_client()
-    rate_xml = cbr_client.service.GetCursDynamic(data1, data2, code)
+    rate_xml = call_service("GetCursDynamic", data1, data2, code)
     try:
-        df = pd.read_xml(rate_xml, xpath="//ValuteCursDynamic")
+        dates, columns = parse_columns(
+            rate_xml, "//ValuteCursDynamic", date_column="CursDate"
+        )
     except ValueError:
-        return pd.Series(dtype=float)
-    cbr_cols1 = {"rowOrder", "id", "Vnom", "Vcode", "CursDate", "Vcurs"}
+        return pd.Series(dtype=float) if output == "pandas" else empty_output(output)
+    # 'id' and 'rowOrder' are dropped by parse_columns
+    cbr_cols1 = {"Vnom", "Vcode", "Vcurs"}
     cbr_cols2 = cbr_cols1.union({"VunitRate"})
-    if set(df.columns) not in [cbr_cols1, cbr_cols2]:
+    if set(columns) not in [cbr_cols1, cbr_cols2]:
         raise ValueError(
             "CBR data has different columns. Probably data format is changed."
         )
-    df.drop(columns=["id", "rowOrder", "Vcode"], inplace=True)
-    if "VunitRate" in list(df.columns):
-        df.drop(columns=["VunitRate"], inplace=True)
-    df["Vcurs"] /= df["Vnom"]
-    df.drop(columns=["Vnom"], inplace=True)
-    df = df.astype({"CursDate": "period[D]"}, copy=False)
-    df = df.astype({"Vcurs": "float"}, copy=False)
-    df.set_index("CursDate", inplace=True, verify_integrity=True)
-    df.sort_index(ascending=True, inplace=True)
-    s = df.squeeze(axis=1)  # all outputs must be pd.Series
+    order = np.argsort(dates, kind="stable")
+    dates = dates[order]
+    if np.any(dates[1:] == dates[:-1]):
+        raise ValueError("CBR data has duplicate dates.")
+    values = columns["Vcurs"].astype(float)[order] / columns["Vnom"][order]
     pad_end_date = data2.date()
     if data1.date() < today < data2.date():
         pad_end_date = today
-    s = pad_missing_periods(s, freq="D", end_date=pad_end_date)
-    s.index.rename("date", inplace=True)
+    if output != "pandas":
+        values = calculate_inverse_rate(values) if method == "inverse" else values
+        return arrays_to_output(
+            dates.astype("int64"),
+            values,
+            [symbol],
+            period,
+            output,
+            end_date=pad_end_date,
+            days=days,
+        )
+    s = pd.Series(
+        values, index=pd.PeriodIndex(dates, freq="D", name="CursDate"), name="Vcurs"
+    )
+    s = pad_missing_periods(s, freq="D", end_date=pad_end_date, days=days)
+    s.index = s.index.rename("date")
     if period.upper() == "M":
         s = s.to_timestamp().resample("ME").last()
     s = calculate_inverse_rate(s) if method == "inverse" else s
@@ -0,0 +1,328 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Optional, Union
+
+import pandas as pd
+
+from cbrapi.cbr_settings import call_service
+from cbrapi.parsing import parse_xml, parse_columns
+from cbrapi.results import cached_result
+from cbrapi.vintage import get_vintage_store
+from cbrapi.helpers import (
+    GROUPED_SYMBOLS,
+    normalize_data,
+    guess_date,
+    check_output,
+    check_layout,
+    check_days,
+    columns_to_frame,
+    columns_to_output,
+    column_rename,
+    empty_output,
+    frame_to_output,
+)
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """
+    Description of a DailyInfo operation returning a time series for a date range.
+
+    Attributes
+    ----------
+    operation : str
+        DailyInfo web service operation called with (first_date, last_date).
+
+    xpath : str
+        Path to the table rows in the reply.
+
+    symbol : str
+        Table name used by normalize_data to unstack grouped data ('MKR', 'DrgMet').
+
+    default_first_date : str
+        First date requested if none is given, in format 'YYYY-MM-DD'.
+
+    level_0, level_1 : dict, optional
+        Column mappings passed to normalize_data.
+
+    divisors : dict, optional
+        Raw columns to divide by a number before normalization (e.g., percents to decimals).
+
+    date_column : str, optional
+        Date column of the table if it is not detected by its name.
+
+    default_period : {'D', 'M'}, default 'D'
+        Data periodicity if none is given.
+    """
+
+    operation: str
+    xpath: str
+    symbol: str
+    default_first_date: str
+    level_0: Optional[dict] = None
+    level_1: Optional[dict] = None
+    divisors: dict = field(default_factory=dict)
+    date_column: Optional[str] = None
+    default_period: str = "D"
+
+
+ENDPOINTS = {
+    "KEY_RATE": Endpoint(
+        operation="KeyRate",
+        xpath=".//KR",
+        symbol="KEY_RATE",
+        default_first_date="2013-09-13",
+        level_1={"Rate": "KEY_RATE"},
+    ),
+    "IBOR": Endpoint(
+        operation="MKR",
+        xpath=".//MKR",
+        symbol="MKR",
+        default_first_date="2013-09-13",
+        level_0={"d1": "D1", "d7": "D7", "d30": "D30", "d90": "D90"},
+        level_1={
+            "1": "MIBID_RUB",
+            "2": "MIBOR_RUB",
+            "3": "MIACR_RUB",
+            "4": "MIACR_IG_RUB",
+            "5": "MIACR_RUB_TURNOVER",
+            "6": "MIACR_IG_RUB_TURNOVER",
+            "7": "MIACR_B_RUB",
+            "8": "MIACR_B_RUB_TURNOVER",
+            "9": "MIBID_USD",
+            "10": "MIBOR_USD",
+            "11": "MIACR_USD",
+            "12": "MIACR_IG_USD",
+            "13": "MIACR_USD_TURNOVER",
+            "14": "MIACR_IG_USD_TURNOVER",
+            "15": "MIACR_B_USD",
+            "16": "MIACR_B_USD_TURNOVER",
+        },
+        default_period="M",
+    ),
+    "DEPOSIT_RATES": Endpoint(
+        operation="DepoDynamic",
+        xpath=".//Depo",
+        symbol="Depo",
+        default_first_date="2010-01-01",
+        level_1={"Overnight": "DEPOSIT_OVERNIGHT"},
+        divisors={"Overnight": 100},
+        date_column="DateDepo",
+    ),
+    "REPO_DEBT": Endpoint(
+        operation="Repo_debt",
+        xpath=".//RD",
+        symbol="RD",
+        default_first_date="2010-01-01",
+        level_1={
+            "debt": "REPO_DEBT",
+            "debt_auc": "REPO_DEBT_AUCTION",
+            "debt_fix": "REPO_DEBT_FIXED_RATE",
+        },
+        date_column="Date",
+    ),
+    "METALS": Endpoint(
+        operation="DragMetDynamic",
+        xpath=".//DrgMet",
+        symbol="DrgMet",
+        default_first_date="1999-10-01",
+        level_1={
+            1: "GOLD",
+            2: "SILVER",
+            3: "PLATINUM",
+            4: "PALLADIUM",
+        },
+    ),
+    "MRRF": Endpoint(
+        operation="mrrf",
+        xpath=".//mr",
+        symbol="mr",
+        default_first_date="1999-01-01",
+        level_1={
+            "p1": "TOTAL_RESERVES",
+            "p2": "CURRENCY_RESERVES",
+            "p3": "FOREIGN_CURRENCY",
+            "p4": "SDR_ACCOUNT",
+            "p5": "IMF_RESERVE",
+            "p6": "MONETARY_GOLD",
+        },
+        default_period="M",
+    ),
+    "RUONIA_INDEX": Endpoint(
+        operation="RuoniaSV",
+        xpath=".//ra",
+        symbol="ra",
+        default_first_date="2010-01-01",
+        level_1={
+            "RUONIA_Index": "RUONIA_INDEX",
+            "R1W": "RUONIA_AVG_1M",
+            "R2W": "RUONIA_AVG_3M",
+            "R1M": "RUONIA_AVG_6M",
+        },
+    ),
+    "RUONIA_OVERNIGHT": Endpoint(
+        operation="Ruonia",
+        xpath="//ro",
+        symbol="ro",
+        default_first_date="2010-01-01",
+        level_1={"ruo": "RUONIA_OVERNIGHT"},
+        divisors={"ruo": 100},
+    ),
+    "ROISFIX": Endpoint(
+        operation="ROISfix",
+        xpath=".//rf",
+        symbol="rf",
+        default_first_date="2011-04-15",
+        level_1={
+            "R1W": "RATE_1_WEEK",
+            "R2W": "RATE_2_WEEK",
+            "R1M": "RATE_1_MONTH",
+            "R2M": "RATE_2_MONTH",
+            "R3M": "RATE_3_MONTH",
+            "R6M": "RATE_6_MONTH",
+        },
+    ),
+}
+
+
+def register_endpoint(name: str, endpoint: Endpoint) -> Endpoint:
+    """
+    Add a DailyInfo operation to the registry so fetch_endpoint can call it by name.
+    """
+    ENDPOINTS[name] = endpoint
+    return endpoint
+
+
+@cached_result
+def fetch_endpoint(
+    endpoint: Union[str, Endpoint],
+    first_date: Optional[str] = None,
+    last_date: Optional[str] = None,
+    period: Optional[str] = None,
+    output: str = "pandas",
+    layout: str = "wide",
+    as_of=None,
+    days: str = "calendar",
+):
+    """
+    Get a time series described by an endpoint from CBR.
+
+    Parameters
+    ----------
+    endpoint : str or Endpoint
+        Endpoint or its name in ENDPOINTS (e.g., 'KEY_RATE').
+
+    first_date : str, optional
+        Start date in format 'YYYY-MM-DD' or 'YYYY-MM'. If not specified,
+        defaults to the first date of the endpoint.
+
+    last_date : str, optional
+        End date in format 'YYYY-MM-DD' or 'YYYY-MM'. If not specified, defaults to
+        current date.
+
+    period : {'D', 'M'}, optional
+        Data periodicity. Defaults to the periodicity of the endpoint.
+
+    output : {'pandas', 'numpy', 'arrow', 'polars'}, default 'pandas'
+        Result type, see get_key_rate.
+
+    layout : {'wide', 'long'}, default 'wide'
+        Table layout for grouped data (MKR, DrgMet), see get_ibor. Other endpoints
+        only support 'wide'.
+
+    as_of : str or datetime, optional
+        Return the values known at this time from the vintage store instead of
+        requesting CBR. Requires enable_vintage_store() and layout='wide'.
+
+    days : {'calendar', 'business'}, default 'calendar'
+        Pad daily data to every calendar day or to weekdays only.
+
+    Returns
+    -------
+    pd.Series or pd.DataFrame
+        Normalized data, or the requested output type.
+
+    Examples
+    --------
+    >>> fetch_endpoint('KEY_RATE', '2023-01-01', '2023-12-31')
+    >>> fetch_endpoint('DEPOSIT_RATES', period='M', output='numpy')
+    >>> fetch_endpoint('MRRF', as_of='2024-03-01')
+    """
+    if isinstance(endpoint, str):
+        try:
+            endpoint = ENDPOINTS[endpoint]
+        except KeyError as e:
+            raise ValueError(f"Unknown CBR endpoint: {endpoint}.") from e
+    check_output(output)
+    check_layout(layout, output, endpoint.symbol)
+    check_days(days)
+    period = period or endpoint.default_period
+    data1 = guess_date(first_date, default_value=endpoint.default_first_date)
+    data2 = guess_date(last_date, default_value=str(date.today()))
+    store = get_vintage_store()
+    if as_of is not None:
+        if store is None:
+            raise ValueError("as_of requires enable_vintage_store().")
+        if layout != "wide":
+            raise ValueError("as_of is only supported for layout='wide'.")
+        data = store.load(endpoint.operation, as_of, data1, data2)
+        if data.empty:
+            return data if output == "pandas" else empty_output(output)
+        if output == "pandas":
+            return normalize_data(data, period, symbol=endpoint.symbol, days=days)
+        frame = data.to_frame() if isinstance(data, pd.Series) else data
+        return frame_to_output(frame, period, output, days=days)
+
+    xml = call_service(endpoint.operation, data1, data2)
+
+    try:
+        if output == "polars":
+            df = parse_xml(xml, xpath=endpoint.xpath)
+        else:
+            dates, columns = parse_columns(
+                xml,
+                endpoint.xpath,
+                endpoint.date_column,
+                endpoint.symbol if layout == "wide" else None,
+            )
+    except ValueError:
+        return empty_output(output)
+
+    if output == "polars":
+        for col, divisor in endpoint.divisors.items():
+            df[col] /= divisor
+        return normalize_data(
+            data=df,
+            period=period,
+            level_0=endpoint.level_0,
+            level_1=endpoint.level_1,
+            symbol=endpoint.symbol,
+            output=output,
+            date_column=endpoint.date_column,
+            days=days,
+        )
+
+    for col, divisor in endpoint.divisors.items():
+        columns[col] = columns[col] / divisor
+    grouped = endpoint.symbol in GROUPED_SYMBOLS
+    if output != "pandas" and store is None and not grouped:
+        return columns_to_output(dates, columns, period, output, endpoint.level_1, days)
+    df = columns_to_frame(dates, columns)
+    if layout == "long":
+        return normalize_data(
+            data=df,
+            period=period,
+            level_0=endpoint.level_0,
+            level_1=endpoint.level_1,
+            symbol=endpoint.symbol,
+            layout=layout,
+            days=days,
+        )
+
+    # observations as published, before padding and resampling
+    observations = column_rename(df, endpoint.level_0, endpoint.level_1)
+    if store is not None:
+        store.record(endpoint.operation, observations)
+    return normalize_data(
+        observations, period, symbol=endpoint.symbol, output=output, days=days
+    )
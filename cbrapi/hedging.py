@@ -0,0 +1,244 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Callable, Iterable, Optional
+
+
+_hedging_policy = None
+
+
+class _Attempt:
+    """
+    A request running in its own thread, with the time it actually started.
+
+    The start is marked by the request itself (e.g., once it has a client of the
+    pool), so time spent waiting for a free client is not counted as latency.
+    """
+
+    def __init__(self, on_start: Optional[Callable] = None):
+        self.future = Future()
+        self.started = threading.Event()
+        self.started_at = time.monotonic()
+        self._on_start = on_start
+
+    def mark_started(self):
+        self.started_at = time.monotonic()
+        if self._on_start is not None:
+            self._on_start()
+        self.started.set()
+
+
+class HedgingPolicy:
+    """
+    Send a duplicate CBR request if the first one is slower than usual.
+
+    The delay before the duplicate is a percentile of recent latencies of the same
+    operation. Whichever request answers first wins; the other one finishes in the
+    background. Duplicates are paid for from a token budget that earns max_rate
+    tokens per request, so hedging adds at most max_rate extra load on average
+    and at most budget requests in a burst.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        min_samples: int = 20,
+        window: int = 200,
+        max_rate: float = 0.05,
+        budget: float = 10,
+        operations: Optional[Iterable[str]] = None,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile should be between 0 and 100.")
+        if not 0 <= max_rate <= 1:
+            raise ValueError("max_rate should be between 0 and 1.")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.max_rate = max_rate
+        self.budget = budget
+        self.operations = None if operations is None else frozenset(operations)
+        self.stats = {"requests": 0, "hedges": 0, "hedge_wins": 0}
+        self._latencies = {}  # operation -> deque of seconds
+        self._tokens = budget
+        self._lock = threading.Lock()
+
+    def applies(self, operation: str) -> bool:
+        """
+        Check if requests of the operation are hedged.
+        """
+        return self.operations is None or operation in self.operations
+
+    def delay(self, operation: str) -> float:
+        """
+        Return seconds to wait for an answer before sending a duplicate request.
+        """
+        with self._lock:
+            samples = sorted(self._latencies.get(operation, ()))
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+        rank = round(self.percentile / 100 * (len(samples) - 1))
+        return max(samples[rank], self.min_delay)
+
+    def _observe(self, operation: str, started: float):
+        latency = time.monotonic() - started
+        with self._lock:
+            samples = self._latencies.get(operation)
+            if samples is None:
+                samples = self._latencies[operation] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def _start(
+        self,
+        operation: str,
+        request: Callable,
+        hedge: bool,
+        on_start: Optional[Callable] = None,
+    ) -> _Attempt:
+        attempt = _Attempt(on_start)
+
+        def run():
+            try:
+                reply = request(hedge, attempt.mark_started)
+            except BaseException as e:
+                attempt.started.set()
+                attempt.future.set_exception(e)
+            else:
+                attempt.started.set()
+                self._observe(operation, attempt.started_at)
+                attempt.future.set_result(reply)
+
+        threading.Thread(target=run, name="cbrapi-hedge", daemon=True).start()
+        return attempt
+
+    def _has_token(self) -> bool:
+        with self._lock:
+            return self._tokens >= 1
+
+    def _spend_token(self):
+        with self._lock:
+            self._tokens -= 1
+            self.stats["hedges"] += 1
+
+    def call(self, operation: str, request: Callable):
+        """
+        Run request(hedge, started) and return its reply, hedging it if it is slow.
+
+        request is called with hedge=False for the first attempt and hedge=True
+        for the duplicate, each in its own thread. It calls started() when the
+        request is actually sent; the delay and latencies are measured from then,
+        and a request that never calls it is not hedged. A duplicate that fails
+        before calling started() does not use the token budget.
+        """
+        with self._lock:
+            self.stats["requests"] += 1
+            self._tokens = min(self._tokens + self.max_rate, self.budget)
+        attempt = self._start(operation, request, False)
+        attempt.started.wait()
+        primary = attempt.future
+        timeout = attempt.started_at + self.delay(operation) - time.monotonic()
+        done, _ = wait([primary], timeout=max(timeout, 0))
+        if done or not self._has_token():
+            return primary.result()
+
+        # the duplicate is paid for once it is sent, not if it finds no free client
+        hedge = self._start(operation, request, True, self._spend_token).future
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.stats["hedge_wins"] += 1
+                    return future.result()
+        return primary.result()
+
+
+def enable_request_hedging(
+    percentile: float = 95,
+    initial_delay: float = 1.0,
+    min_delay: float = 0.05,
+    min_samples: int = 20,
+    window: int = 200,
+    max_rate: float = 0.05,
+    budget: float = 10,
+    operations: Optional[Iterable[str]] = None,
+) -> HedgingPolicy:
+    """
+    Send a duplicate request to CBR when a reply is slower than usual.
+
+    Parameters
+    ----------
+    percentile : float, default 95
+        Percentile of recent latencies of an operation after which the duplicate is sent.
+
+    initial_delay : float, default 1.0
+        Seconds to wait before hedging while fewer than min_samples latencies are known.
+
+    min_delay : float, default 0.05
+        Lower bound of the delay in seconds.
+
+    min_samples : int, default 20
+        Number of latencies of an operation needed to use the percentile.
+
+    window : int, default 200
+        Number of recent latencies kept per operation.
+
+    max_rate : float, default 0.05
+        Share of requests that may be duplicated on average.
+
+    budget : float, default 10
+        Maximum number of duplicates sent in a burst.
+
+    operations : iterable of str, optional
+        DailyInfo operations to hedge (e.g., ['KeyRate', 'GetCursDynamic']).
+        All operations are hedged if not specified.
+
+    Returns
+    -------
+    HedgingPolicy
+        The policy in use. Its stats attribute counts requests, hedges and hedge wins.
+
+    Notes
+    -----
+    The duplicate uses a second client of the pool and is skipped if the pool has
+    no free client, so hedging never waits for a client.
+
+    Examples
+    --------
+    >>> enable_request_hedging(percentile=90, operations=['KeyRate', 'GetCursDynamic'])
+    >>> get_key_rate()
+    """
+    global _hedging_policy
+    _hedging_policy = HedgingPolicy(
+        percentile,
+        initial_delay,
+        min_delay,
+        min_samples,
+        window,
+        max_rate,
+        budget,
+        operations,
+    )
+    return _hedging_policy
+
+
+def disable_request_hedging():
+    """
+    Stop sending duplicate requests to CBR.
+    """
+    global _hedging_policy
+    _hedging_policy = None
+
+
+def get_hedging_policy() -> Optional[HedgingPolicy]:
+    """
+    Return the hedging policy in use or None if hedging is disabled.
+    """
+    return _hedging_policy
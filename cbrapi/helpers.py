@@ -1,13 +1,63 @@
+from functools import lru_cache
 from typing import Union, Optional
 from datetime import datetime, date
+import numpy as np
 import pandas as pd
 
 
+OUTPUTS = ("pandas", "numpy", "arrow", "polars")
+
+DATE_COLUMN_KEYWORDS = ("CDate", "DateMet", "D0", "DT")
+
+UNNECESSARY_COLUMNS = ("id", "rowOrder", "vol", "DateUpdate")
+
+LAYOUTS = ("wide", "long")
+
+# 'business' pads daily data to weekdays only, 'calendar' to every day
+DAYS = ("calendar", "business")
+
+# value columns and group column of the responses with several series in one table
+GROUPED_SYMBOLS = {
+    "DrgMet": (["price"], "CodMet"),
+    "MKR": (["d1", "d7", "d30", "d90"], "p1"),
+}
+
+
+def check_days(days: str) -> str:
+    """
+    Check the padding calendar requested from a get_* function.
+    """
+    if days not in DAYS:
+        raise ValueError(f"days should be one of {DAYS}, got '{days}'.")
+    return days
+
+
+@lru_cache(maxsize=256)
+def period_index(
+    start: pd.Period, end: pd.Period, freq: str = "D", days: str = "calendar"
+) -> pd.PeriodIndex:
+    """
+    Build a PeriodIndex from start to end, cached for calls with the same bounds.
+
+    With days='business' weekends are left out of daily indexes.
+    """
+    index = pd.period_range(start=start, end=end, freq=freq)
+    if days == "business" and index.freqstr == "D":
+        index = index[index.dayofweek < 5]
+    return index
+
+
 def pad_missing_periods(
-    ts: Union[pd.Series, pd.DataFrame], freq: str = "D", end_date: Optional[date] = None
+    ts: Union[pd.Series, pd.DataFrame],
+    freq: str = "D",
+    end_date: Optional[date] = None,
+    days: str = "calendar",
 ) -> Union[pd.Series, pd.DataFrame]:
     """
     Pad missing dates and values in the time series.
+
+    With days='business' daily data is padded to weekdays only, and a value
+    published on a weekend is carried to the next Monday.
     """
     if ts.empty:
         return ts
@@ -22,12 +72,163 @@ def pad_missing_periods(
         end_period = pd.Period(end_date, freq=freq)
         if end_period > end:
             end = end_period
-    idx = pd.period_range(start=ts.index[0], end=end, freq=freq)
+    idx = period_index(ts.index[0], end, freq, days)
     ts = ts.reindex(idx, method="pad")
-    ts.index.rename(name, inplace=True)
+    # a new index object, so renaming the result never changes the cached one
+    ts.index = ts.index.rename(name)
     return ts
 
 
+def check_output(output: str) -> str:
+    """
+    Check the result type requested from a get_* function.
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"output should be one of {OUTPUTS}, got '{output}'.")
+    return output
+
+
+def pad_missing_arrays(
+    dates: np.ndarray,
+    values: np.ndarray,
+    end_date: Optional[date] = None,
+    days: str = "calendar",
+) -> tuple:
+    """
+    Pad missing days and values in raw arrays.
+
+    dates are int64 day ordinals since 1970-01-01, values are a 1-D or 2-D array
+    with one row per date. Works like pad_missing_periods without building a PeriodIndex.
+    """
+    if dates.size == 0:
+        return dates, values
+    order = np.argsort(dates, kind="stable")
+    dates, values = dates[order], values[order]
+    end = dates[-1]
+    if end_date:
+        end = max(end, np.datetime64(end_date, "D").astype("int64"))
+    padded_dates = np.arange(dates[0], end + 1, dtype="int64")
+    if days == "business":
+        # 1970-01-01 is a Thursday
+        padded_dates = padded_dates[(padded_dates + 3) % 7 < 5]
+    positions = np.searchsorted(dates, padded_dates, side="right") - 1
+    return padded_dates, values[positions]
+
+
+def resample_arrays_last(dates: np.ndarray, values: np.ndarray) -> tuple:
+    """
+    Take the last valid value of each month from padded daily arrays.
+
+    Returns int64 month ordinals since 1970-01 and the values, like
+    resample("M").last() does for a DataFrame.
+    """
+    if dates.size == 0:
+        return dates, values
+    months = dates.astype("datetime64[D]").astype("datetime64[M]").astype("int64")
+    month_ends = np.flatnonzero(np.diff(months, append=months[-1] + 1))
+    month_starts = np.concatenate(([0], month_ends[:-1] + 1))
+
+    values_2d = values.reshape(len(values), -1).astype(float, copy=False)
+    rows = np.arange(len(values_2d))[:, np.newaxis]
+    last_valid = np.maximum.accumulate(
+        np.where(np.isnan(values_2d), -1, rows), axis=0
+    )[month_ends]
+    in_month = last_valid >= month_starts[:, np.newaxis]
+    columns = np.arange(values_2d.shape[1])
+    result = np.where(
+        in_month, values_2d[np.maximum(last_valid, 0), columns], np.nan
+    )
+    return months[month_ends], result.reshape((len(month_ends),) + values.shape[1:])
+
+
+def _index_to_days(index: pd.Index) -> np.ndarray:
+    if isinstance(index, pd.PeriodIndex):
+        return index.asfreq("D", how="start").asi8
+    return index.values.astype("datetime64[D]").astype("int64")
+
+
+def _flat_column_names(columns: pd.Index) -> list:
+    if isinstance(columns, pd.MultiIndex):
+        return ["_".join(str(level) for level in col) for col in columns]
+    return [str(col) for col in columns]
+
+
+def arrays_to_output(
+    dates: np.ndarray,
+    values: np.ndarray,
+    columns: list,
+    period: str,
+    output: str,
+    end_date: Optional[date] = None,
+    days: str = "calendar",
+):
+    """
+    Pad and resample raw arrays and return them in the requested result type.
+
+    'numpy' returns a (dates, values) pair, where dates are int64 day ordinals
+    (month ordinals for period 'M') and values have one column per name in columns
+    or are 1-D for a single column. 'arrow' and 'polars' return a table with a 'date' column.
+    """
+    dates, values = pad_missing_arrays(dates, values, end_date, days)
+    if period.upper() == "M":
+        dates, values = resample_arrays_last(dates, values)
+    if values.ndim == 2 and values.shape[1] == 1:
+        values = values[:, 0]
+    if output == "numpy":
+        return dates, values
+
+    unit = "datetime64[M]" if period.upper() == "M" else "datetime64[D]"
+    day_dates = dates.astype(unit).astype("datetime64[D]")
+    values_2d = values.reshape(len(values), len(columns))
+    if output == "polars":
+        from cbrapi.polars_backend import require_polars
+
+        pl = require_polars()
+        columns_data = {name: values_2d[:, i] for i, name in enumerate(columns)}
+        return pl.DataFrame({"date": day_dates, **columns_data})
+
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("output='arrow' requires the 'pyarrow' package.") from e
+    arrays = {"date": pa.array(day_dates)}
+    for i, name in enumerate(columns):
+        arrays[name] = pa.array(values_2d[:, i])
+    return pa.table(arrays)
+
+
+def frame_to_output(
+    data: pd.DataFrame,
+    period: str,
+    output: str,
+    end_date: Optional[date] = None,
+    days: str = "calendar",
+):
+    """
+    Convert a DataFrame with a date index to raw arrays in the requested result type.
+    """
+    return arrays_to_output(
+        _index_to_days(data.index),
+        data.to_numpy(dtype=float),
+        _flat_column_names(data.columns),
+        period,
+        output,
+        end_date,
+        days,
+    )
+
+
+def empty_output(output: str):
+    """
+    Return an empty result of the requested type.
+    """
+    if output == "pandas":
+        return pd.Series()
+    return arrays_to_output(
+        np.empty(0, dtype="int64"), np.empty(0, dtype=float), [], "D", output
+    )
+
+
 def calculate_inverse_rate(close_ts):
     """
     Inverse close values for currency rate data.
@@ -35,13 +236,51 @@ def calculate_inverse_rate(close_ts):
     return 1.0 / close_ts
 
 
-def set_datetime_index(data):
+def find_date_column(columns, date_column=None):
+    """
+    Return the date column of a CBR table, detected by DATE_COLUMN_KEYWORDS
+    unless date_column is given.
+    """
+    for col in columns:
+        if col == date_column or (
+            date_column is None
+            and any(keyword in str(col) for keyword in DATE_COLUMN_KEYWORDS)
+        ):
+            return col
+    raise KeyError("CBR table has no date column.")
+
+
+def to_datetime64(values: np.ndarray) -> np.ndarray:
+    """
+    Convert CBR dates (e.g., '2024-01-03T00:00:00+03:00') to datetime64[D].
+
+    Time and UTC offset are dropped, as set_datetime_index does.
+    """
+    if values.dtype == object:
+        values = values.astype("U10")
+    return values.astype("datetime64[D]")
+
+
+def columns_to_frame(dates: np.ndarray, columns: dict) -> pd.DataFrame:
+    """
+    Build a DataFrame with a 'DATE' index from arrays made by parsing.parse_columns.
+    """
+    index = pd.DatetimeIndex(dates.astype("datetime64[ns]"), name="DATE")
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
+def set_datetime_index(data, date_column=None):
     """
     Set datetime index for DataFrame by detecting date columns.
+
+    date_column overrides the detection by DATE_COLUMN_KEYWORDS.
     """
     if not isinstance(data.index, pd.DatetimeIndex):
         for col in data.columns:
-            if any(keyword in str(col) for keyword in ["CDate", "DateMet", "D0", "DT"]):
+            if col == date_column or (
+                date_column is None
+                and any(keyword in str(col) for keyword in DATE_COLUMN_KEYWORDS)
+            ):
                 if data[col].dtype == "object":
                     data[col] = data[col].str.split("T").str[0]
 
@@ -57,11 +296,7 @@ def remove_unnecessary_columns(data):
     Remove unnecessary columns from DataFrame.
     """
     data.drop(
-        columns=[
-            col
-            for col in ["id", "rowOrder", "vol", "DateUpdate"]
-            if col in data.columns
-        ],
+        columns=[col for col in UNNECESSARY_COLUMNS if col in data.columns],
         inplace=True,
     )
     return data
@@ -70,7 +305,12 @@ def remove_unnecessary_columns(data):
 def unstack_groups(data, symbol):
     """
     Unstack grouped data based on symbol type.
+
+    Data that is already unstacked (has no group column) is returned as is.
     """
+    if symbol not in GROUPED_SYMBOLS or GROUPED_SYMBOLS[symbol][1] not in data:
+        return data
+
     if symbol == "DrgMet":
         data = data.groupby([data.index, "CodMet"])["price"].first().unstack()
         data.columns.name = None
@@ -87,6 +327,146 @@ def unstack_groups(data, symbol):
     return data
 
 
+def rename_columns(columns: dict, level_1=None) -> dict:
+    """
+    Rename parsed columns like column_rename does for a table without groups.
+    """
+    if level_1 and isinstance(level_1, dict):
+        renamed = {level_1.get(name, name): values for name, values in columns.items()}
+        available = [name for name in level_1.values() if name in renamed]
+        if available:
+            return {name: renamed[name] for name in available}
+        return renamed
+    if level_1 and len(columns) == 1:
+        return {str(level_1): next(iter(columns.values()))}
+    return columns
+
+
+def columns_to_output(
+    dates: np.ndarray,
+    columns: dict,
+    period: str,
+    output: str,
+    level_1=None,
+    days: str = "calendar",
+):
+    """
+    Return arrays made by parsing.parse_columns in the requested result type.
+
+    For tables without groups this gives the same result as normalize_data
+    with output 'numpy' or 'arrow', without building a DataFrame.
+    """
+    columns = rename_columns(columns, level_1)
+    values = np.empty((len(dates), len(columns)))
+    for i, column in enumerate(columns.values()):
+        values[:, i] = column
+    return arrays_to_output(
+        dates.astype("int64"),
+        values,
+        [str(name) for name in columns],
+        period,
+        output,
+        days=days,
+    )
+
+
+def check_layout(layout: str, output: str, symbol: Optional[str] = None) -> str:
+    """
+    Check the table layout requested from a get_* function.
+
+    If symbol is given, layout 'long' is only accepted for grouped data.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"layout should be one of {LAYOUTS}, got '{layout}'.")
+    if layout == "long" and output != "pandas":
+        raise ValueError("layout='long' is only available with output='pandas'.")
+    if layout == "long" and symbol is not None and symbol not in GROUPED_SYMBOLS:
+        raise ValueError(
+            f"layout='long' is only available for grouped data {tuple(GROUPED_SYMBOLS)}."
+        )
+    return layout
+
+
+def _categorical(keys, mapping: Optional[dict]) -> pd.Categorical:
+    """
+    Encode raw group keys as a categorical with mapped names as categories.
+
+    Keys missing from the mapping are added as extra categories under their raw key.
+    """
+    mapping = mapping or {}
+    keys = np.asarray(keys).astype(str)
+    categories = pd.Index([str(key) for key in mapping])
+    unmapped = pd.unique(keys[categories.get_indexer(keys) == -1])
+    categories = categories.append(pd.Index(unmapped))
+    return pd.Categorical.from_codes(
+        categories.get_indexer(keys), categories=list(mapping.values()) + list(unmapped)
+    )
+
+
+def to_long_format(data, symbol, period, level_0=None, level_1=None):
+    """
+    Convert grouped data to a long table without groupby/unstack.
+
+    Returns a DataFrame with 'date', 'series_id', 'tenor' (for several value columns)
+    and 'value' columns. series_id and tenor are integer-coded categoricals.
+    Only observed values are kept, missing periods are not padded.
+    Groups missing from level_1 are kept or dropped as in the wide table.
+    """
+    value_columns, group_column = GROUPED_SYMBOLS[symbol]
+    group_keys = data[group_column].to_numpy()
+    if len(value_columns) == 1 and isinstance(level_1, dict) and level_1:
+        # like column_rename, a single table keeps only mapped groups if there are any
+        mapped = np.isin(group_keys.astype(str), [str(key) for key in level_1])
+        if mapped.any():
+            data, group_keys = data[mapped], group_keys[mapped]
+    values = data[value_columns].to_numpy(dtype=float)
+    n_rows, n_values = values.shape
+
+    days = data.index.to_period("D").asi8
+    long = {
+        "date": pd.PeriodIndex.from_ordinals(np.repeat(days, n_values), freq="D"),
+        "series_id": _categorical(np.repeat(group_keys, n_values), level_1),
+    }
+    if n_values > 1:
+        tenors = level_0 or {col: col for col in value_columns}
+        long["tenor"] = pd.Categorical.from_codes(
+            np.tile(np.arange(n_values), n_rows),
+            categories=[tenors.get(col, col) for col in value_columns],
+        )
+    long["value"] = values.ravel()
+    long = pd.DataFrame(long)
+    long = long[long["value"].notna()]
+
+    # sort by day before taking the last value of each month
+    keys = [col for col in ("series_id", "tenor") if col in long.columns]
+    long = long.sort_values(["date"] + keys, kind="stable")
+    if period.upper() == "M":
+        long["date"] = long["date"].dt.asfreq("M")
+        long = long.drop_duplicates(["date"] + keys, keep="last")
+        long = long.sort_values(["date"] + keys, kind="stable")
+    return long.reset_index(drop=True)
+
+
+def long_to_wide(long: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the wide padded table from a long table made by to_long_format.
+
+    Series that have no observed values do not get a column.
+    """
+    keys = [col for col in ("tenor", "series_id") if col in long.columns]
+    data = long.set_index(["date"] + keys)["value"].unstack(keys)
+    data = data.sort_index(axis=1)  # categories keep the order of the mappings
+    if len(keys) == 1:
+        data.columns = data.columns.astype(object)
+    else:
+        data.columns = data.columns.set_levels(
+            [level.astype(object) for level in data.columns.levels]
+        )
+    data.columns.names = [None] * len(keys)
+    data.index.name = "DATE"
+    return pad_missing_periods(data, freq=data.index.freqstr)
+
+
 def column_rename(data, level_0, level_1):
     """
     Rename columns based on mapping dictionaries.
@@ -113,22 +493,50 @@ def column_rename(data, level_0, level_1):
     return data
 
 
-def normalize_data(data, period, level_0=None, level_1=None, symbol=None):
+def normalize_data(
+    data,
+    period,
+    level_0=None,
+    level_1=None,
+    symbol=None,
+    output="pandas",
+    layout="wide",
+    date_column=None,
+    days="calendar",
+):
     """
     Normalize time series data through multiple processing steps.
+
+    For output 'numpy' or 'arrow' padding and resampling are done on raw arrays.
+    For output 'polars' the whole pipeline runs in Polars.
+    For layout 'long' grouped data is returned as a long table (see to_long_format).
+    With days='business' daily data is padded to weekdays only.
     """
     if isinstance(data, pd.Series):
         data = data.to_frame()
 
-    set_datetime_index(data)
+    if output == "polars":
+        from cbrapi.polars_backend import normalize_data_pl
+
+        return normalize_data_pl(
+            data, period, level_0, level_1, symbol, date_column, days
+        )
+
+    set_datetime_index(data, date_column)
 
     remove_unnecessary_columns(data)
 
+    if layout == "long" and symbol in GROUPED_SYMBOLS:
+        return to_long_format(data, symbol, period, level_0, level_1)
+
     data = unstack_groups(data, symbol)
 
     data = column_rename(data, level_0, level_1)
 
-    data = pad_missing_periods(data)
+    if output != "pandas":
+        return frame_to_output(data, period, output, days=days)
+
+    data = pad_missing_periods(data, days=days)
 
     if period.upper() == "M":
         data = data.resample("M").last()
@@ -139,19 +547,29 @@ def normalize_data(data, period, level_0=None, level_1=None, symbol=None):
     return data
 
 
+@lru_cache(maxsize=4096)
+def parse_date(text: str) -> datetime:
+    """
+    Parse a date in format 'YYYY-MM-DD' or 'YYYY-MM' (the first day of the month).
+
+    Results are cached, so repeated requests with the same bounds parse them once.
+    """
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        return datetime.fromisoformat(text)
+    if len(text) == 7 and text[4] == "-" and text[5:].isdigit():
+        return datetime(int(text[:4]), int(text[5:]), 1)
+    try:
+        return datetime.strptime(text, "%Y-%m-%d")
+    except ValueError:
+        return datetime.strptime(text, "%Y-%m")
+
+
 def guess_date(input_date, default_value):
     """
     Create data in datetime format.
     CBR accepts "%Y-%m-%d" format only.
     """
-    if input_date:
-        try:
-            date = datetime.strptime(input_date, "%Y-%m-%d")
-        except ValueError:
-            date = datetime.strptime(input_date, "%Y-%m")
-    else:
-        date = datetime.strptime(default_value, "%Y-%m-%d")
-    return date
+    return parse_date(input_date or default_value)
 
 
 def check_ticker_code(ticker, symbol_col):
@@ -1,17 +1,18 @@
-from datetime import date
 from typing import Optional
 
 import pandas as pd
 
-from cbrapi.cbr_settings import make_cbr_client
-from cbrapi.helpers import normalize_data, guess_date
-
-
-today = date.today()
+from cbrapi.endpoints import fetch_endpoint
 
 
 def get_metals_prices(
-    first_date: Optional[str] = None, last_date: Optional[str] = None, period: str = "D"
+    first_date: Optional[str] = None,
+    last_date: Optional[str] = None,
+    period: str = "D",
+    output: str = "pandas",
+    layout: str = "wide",
+    as_of=None,
+    days: str = "calendar",
 ) -> pd.DataFrame:
     """
     Get precious metals prices time series from CBR.
@@ -29,6 +30,26 @@ def get_metals_prices(
     period: {'D', 'M'}, default 'D'
         Data periodicity. Currently daily ('D') and monthly ('M') frequencies are supported.
 
+    output : {'pandas', 'numpy', 'arrow', 'polars'}, default 'pandas'
+        Result type. 'numpy' returns a (dates, values) pair of arrays, where dates are
+        int64 day ordinals since 1970-01-01 (month ordinals for monthly data).
+        'arrow' returns a pyarrow.Table with a 'date' column.
+        Both skip building the pandas index and pad the raw arrays.
+        'polars' returns a polars.DataFrame with a 'date' column.
+
+    layout : {'wide', 'long'}, default 'wide'
+        'long' returns a tidy DataFrame with 'date', 'series_id' and 'value' columns
+        instead of one column per metal. series_id is a categorical, and only observed
+        values are kept. Use long_to_wide to build the wide table later.
+        Requires output='pandas'.
+
+    as_of : str or datetime, optional
+        Return the values known at this time from the vintage store instead of
+        requesting CBR. Requires enable_vintage_store().
+
+    days : {'calendar', 'business'}, default 'calendar'
+        Pad daily data to every calendar day or to weekdays only (about 30% fewer rows).
+
     Returns
     -------
     pd.DataFrame
@@ -48,24 +69,6 @@ def get_metals_prices(
     >>> get_metals_prices('2023-01-01', '2023-12-31')
     >>> get_metals_prices(period='M')
     """
-    cbr_client = make_cbr_client()
-    data1 = guess_date(first_date, default_value="1999-10-01")
-    data2 = guess_date(last_date, default_value=str(today))
-    metals_xml = cbr_client.service.DragMetDynamic(data1, data2)
-
-    try:
-        df = pd.read_xml(metals_xml, xpath=".//DrgMet")
-    except ValueError:
-        return pd.Series()
-
-    level_1_column_mapping = {
-        1: "GOLD",
-        2: "SILVER",
-        3: "PLATINUM",
-        4: "PALLADIUM",
-    }
-
-    df = normalize_data(
-        data=df, period=period, symbol="DrgMet", level_1=level_1_column_mapping
+    return fetch_endpoint(
+        "METALS", first_date, last_date, period, output, layout, as_of, days=days
     )
-    return df
@@ -0,0 +1,123 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import pandas as pd
+
+from cbrapi.helpers import (
+    GROUPED_SYMBOLS,
+    UNNECESSARY_COLUMNS,
+    find_date_column,
+    to_datetime64,
+    unstack_groups,
+)
+
+
+_parse_executor = None
+
+
+def _read_columns(xml, xpath: str) -> dict:
+    """
+    Parse a CBR reply into a dict of column arrays. Runs in a worker process.
+    """
+    df = pd.read_xml(xml, xpath=xpath)
+    return {col: df[col].to_numpy() for col in df.columns}
+
+
+def _read_table(xml, xpath: str, date_column=None, symbol=None) -> tuple:
+    """
+    Parse a CBR time series reply and run the steps of normalize_data before the index.
+
+    Runs in a worker process if process parsing is enabled.
+    """
+    df = pd.read_xml(xml, xpath=xpath)
+    date_col = find_date_column(df.columns, date_column)
+    dates = to_datetime64(df[date_col].to_numpy())
+    df = df.drop(
+        columns=[date_col] + [col for col in UNNECESSARY_COLUMNS if col in df.columns]
+    )
+    if symbol in GROUPED_SYMBOLS:
+        df.index = pd.DatetimeIndex(dates.astype("datetime64[ns]"))
+        df = unstack_groups(df, symbol)
+        dates = df.index.to_numpy().astype("datetime64[D]")
+    return dates, {col: df[col].to_numpy() for col in df.columns}
+
+
+def parse_xml(xml, xpath: str) -> pd.DataFrame:
+    """
+    Parse a CBR reply into a DataFrame.
+
+    The XML is parsed in a worker process if process parsing is enabled.
+    Raises ValueError if the xpath matches no rows, as pd.read_xml does.
+    """
+    if _parse_executor is None:
+        return pd.read_xml(xml, xpath=xpath)
+    columns = _parse_executor.submit(_read_columns, xml, xpath).result()
+    return pd.DataFrame(columns, copy=False)
+
+
+def parse_columns(xml, xpath: str, date_column=None, symbol=None) -> tuple:
+    """
+    Parse a CBR time series reply into (dates, columns).
+
+    dates is a datetime64[D] array, columns maps column names to arrays.
+    Unnecessary columns are dropped, and if symbol is a grouped table ('MKR',
+    'DrgMet') it is unstacked to one column per series (named by tuples for MKR).
+    Everything runs in a worker process if process parsing is enabled, so only
+    numeric arrays come back. Raises ValueError if the xpath matches no rows.
+    """
+    if _parse_executor is None:
+        return _read_table(xml, xpath, date_column, symbol)
+    return _parse_executor.submit(
+        _read_table, xml, xpath, date_column, symbol
+    ).result()
+
+
+def enable_process_parsing(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Parse CBR replies in a pool of worker processes.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    ProcessPoolExecutor
+        The pool in use.
+
+    Notes
+    -----
+    Useful for bulk backfills where many threads fetch series at once and XML parsing
+    holds the GIL. Raw replies are sent to the workers, which also parse dates to
+    datetime64, drop unused columns and unstack MKR and DrgMet tables. Time series
+    come back as numeric NumPy arrays, which pickle as plain buffers. For a single
+    small request the overhead of the round trip outweighs the gain.
+
+    Workers are started with the 'forkserver' method ('spawn' where it is not
+    available) rather than forked, since forking a process with running client
+    pool and hedging threads can deadlock the child on an inherited lock.
+
+    Examples
+    --------
+    >>> enable_process_parsing(max_workers=4)
+    """
+    global _parse_executor
+    disable_process_parsing()
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+    _parse_executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+    return _parse_executor
+
+
+def disable_process_parsing():
+    """
+    Parse CBR replies in the calling thread and shut the worker processes down.
+    """
+    global _parse_executor
+    if _parse_executor is not None:
+        _parse_executor.shutdown()
+        _parse_executor = None
@@ -0,0 +1,140 @@
+import pandas as pd
+
+from cbrapi.helpers import DATE_COLUMN_KEYWORDS, UNNECESSARY_COLUMNS
+
+try:
+    import polars as pl
+except ImportError:  # polars is an optional dependency
+    pl = None
+
+
+def require_polars():
+    """
+    Return the polars module or raise ImportError if it is not installed.
+    """
+    if pl is None:
+        raise ImportError("output='polars' requires the 'polars' package.")
+    return pl
+
+
+def to_polars(data: pd.DataFrame) -> "pl.DataFrame":
+    """
+    Convert a parsed CBR reply or a frame with a date index to a Polars frame.
+    """
+    require_polars()
+    if isinstance(data.index, pd.PeriodIndex):
+        data = data.to_timestamp()
+    if isinstance(data.index, pd.DatetimeIndex):
+        data = data.rename_axis("date").reset_index()
+    return pl.from_pandas(data)
+
+
+def set_date_column(frame: "pl.DataFrame", date_column=None) -> "pl.DataFrame":
+    """
+    Detect the date column and convert it to a 'date' column of Date type.
+    """
+    if "date" in frame.columns and date_column is None:
+        return frame.with_columns(pl.col("date").cast(pl.Date))
+    for col in frame.columns:
+        if col == date_column or (
+            date_column is None
+            and any(keyword in col for keyword in DATE_COLUMN_KEYWORDS)
+        ):
+            if frame.schema[col] == pl.String:
+                date = pl.col(col).str.split("T").list.first().str.to_date()
+            else:
+                date = pl.col(col).cast(pl.Date)
+            return frame.with_columns(date.alias("date")).drop(col)
+    return frame
+
+
+def unstack_groups_pl(frame: "pl.DataFrame", symbol) -> "pl.DataFrame":
+    """
+    Pivot grouped data based on symbol type.
+
+    MKR columns are named '<tenor>_<rate type>' as Polars has no column MultiIndex.
+    """
+    if symbol == "DrgMet":
+        frame = frame.pivot(
+            on="CodMet", index="date", values="price", aggregate_function="first"
+        )
+    if symbol == "MKR":
+        frame = frame.pivot(
+            on="p1",
+            index="date",
+            values=["d1", "d7", "d30", "d90"],
+            aggregate_function="first",
+            separator="_",
+        )
+    return frame
+
+
+def column_rename_pl(frame: "pl.DataFrame", level_0, level_1, symbol):
+    """
+    Rename columns based on mapping dictionaries.
+    """
+    columns = [col for col in frame.columns if col != "date"]
+    if symbol == "MKR":
+        level_0 = level_0 or {}
+        level_1 = {str(key): value for key, value in (level_1 or {}).items()}
+        renames = {}
+        for col in columns:
+            tenor, _, rate_type = col.partition("_")
+            tenor = level_0.get(tenor, tenor)
+            renames[col] = f"{tenor}_{level_1.get(rate_type, rate_type)}"
+        return frame.rename(renames)
+
+    if level_1 and isinstance(level_1, dict):
+        level_1 = {str(key): value for key, value in level_1.items()}
+        frame = frame.rename({col: level_1[col] for col in columns if col in level_1})
+        available_columns = [col for col in level_1.values() if col in frame.columns]
+        if available_columns:
+            frame = frame.select(["date"] + available_columns)
+    elif level_1 and len(columns) == 1:
+        frame = frame.rename({columns[0]: str(level_1)})
+    return frame
+
+
+def pad_missing_periods_pl(
+    frame: "pl.DataFrame", days: str = "calendar"
+) -> "pl.DataFrame":
+    """
+    Pad missing days with the last known row.
+    With days='business' weekends are left out.
+    """
+    if frame.is_empty():
+        return frame
+    frame = frame.sort("date")
+    index = pl.date_range(
+        frame["date"].min(), frame["date"].max(), "1d", eager=True
+    ).alias("date")
+    if days == "business":
+        index = index.filter(index.dt.weekday() <= 5)
+    return index.to_frame().join_asof(frame, on="date", strategy="backward")
+
+
+def normalize_data_pl(
+    data: pd.DataFrame,
+    period,
+    level_0=None,
+    level_1=None,
+    symbol=None,
+    date_column=None,
+    days="calendar",
+) -> "pl.DataFrame":
+    """
+    Normalize time series data with Polars.
+
+    Runs the same steps as helpers.normalize_data and returns a polars.DataFrame
+    with a 'date' column.
+    """
+    frame = set_date_column(to_polars(data), date_column)
+    frame = frame.drop([col for col in UNNECESSARY_COLUMNS if col in frame.columns])
+    frame = unstack_groups_pl(frame, symbol)
+    frame = column_rename_pl(frame, level_0, level_1, symbol)
+    frame = pad_missing_periods_pl(frame, days)
+    if period.upper() == "M":
+        frame = frame.group_by_dynamic("date", every="1mo").agg(
+            pl.exclude("date").drop_nulls().last()
+        )
+    return frame
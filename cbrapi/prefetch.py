@@ -0,0 +1,186 @@
+import argparse
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta, timezone
+from typing import Iterable, Optional
+
+from cbrapi.cache import enable_response_cache, refresh_responses
+
+
+# Moscow time has no daylight saving since 2014
+MOSCOW_TZ = timezone(timedelta(hours=3), name="MSK")
+
+# RUONIA is published by 14:00 MSK, official exchange rates and metals prices after 15:30 MSK
+DEFAULT_TIMES = (time(14, 5), time(15, 35))
+
+# prefetched replies stay valid this long after the next window, while it is prefetched
+REFRESH_GRACE = timedelta(minutes=10)
+
+
+@dataclass(frozen=True)
+class PrefetchJob:
+    """
+    A cbrapi function call to repeat after each publication window.
+
+    The arguments should be the same as consumers use to hit the same cache entries.
+    """
+
+    func: str
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+
+    def run(self):
+        import cbrapi
+
+        return getattr(cbrapi, self.func)(*self.args, **self.kwargs)
+
+    @classmethod
+    def parse(cls, spec: str) -> "PrefetchJob":
+        """
+        Create a job from a string like 'get_time_series:USD,2020-01-01,2025-12-31'.
+        """
+        func, _, args = spec.partition(":")
+        return cls(func, tuple(arg for arg in args.split(",") if arg))
+
+
+DEFAULT_JOBS = (
+    PrefetchJob("get_key_rate"),
+    PrefetchJob("get_ruonia_overnight"),
+    PrefetchJob("get_ruonia_index"),
+    PrefetchJob("get_metals_prices"),
+    PrefetchJob("get_currencies_list"),
+)
+
+
+class Prefetcher:
+    """
+    Refresh the shared response cache after each CBR publication window.
+
+    Parameters
+    ----------
+    jobs : iterable of PrefetchJob
+        Function calls to refresh.
+
+    times : iterable of datetime.time
+        Moscow time of the publication windows. Jobs run on weekdays only.
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[PrefetchJob] = DEFAULT_JOBS,
+        times: Iterable[time] = DEFAULT_TIMES,
+    ):
+        self.jobs = list(jobs)
+        self.times = sorted(times)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def run_once(self) -> list:
+        """
+        Refresh all jobs. Returns a list of (job, exception or None) pairs.
+
+        The refreshed replies stay valid until shortly after the next publication
+        window, so consumers keep hitting them between the windows.
+        """
+        results = []
+        with refresh_responses(expires=self.next_run() + REFRESH_GRACE):
+            for job in self.jobs:
+                try:
+                    job.run()
+                    results.append((job, None))
+                except Exception as e:
+                    results.append((job, e))
+        return results
+
+    def next_run(self, now: Optional[datetime] = None) -> datetime:
+        """
+        Return the next publication window after now.
+        """
+        now = (now or datetime.now(MOSCOW_TZ)).astimezone(MOSCOW_TZ)
+        day = now.date()
+        while True:
+            if day.weekday() < 5:
+                for at in self.times:
+                    run_at = datetime.combine(day, at, tzinfo=MOSCOW_TZ)
+                    if run_at > now:
+                        return run_at
+            day += timedelta(days=1)
+
+    def run_forever(self):
+        """
+        Refresh jobs after each publication window until stop() is called.
+        """
+        while not self._stop.is_set():
+            delay = (self.next_run() - datetime.now(MOSCOW_TZ)).total_seconds()
+            if self._stop.wait(max(delay, 0)):
+                break
+            self.run_once()
+
+    def start(self) -> threading.Thread:
+        """
+        Run the scheduler in a daemon thread.
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run_forever, name="cbrapi-prefetch", daemon=True
+        )
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        """
+        Stop the scheduler thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="cbrapi prefetch",
+        description="Refresh the cbrapi response cache after CBR publication windows.",
+    )
+    parser.add_argument("--cache-dir", help="response cache directory")
+    parser.add_argument(
+        "--job",
+        action="append",
+        dest="jobs",
+        metavar="FUNC[:ARG,...]",
+        help="cbrapi function to prefetch, e.g. get_time_series:USD,2020-01-01,2025-12-31",
+    )
+    parser.add_argument(
+        "--at",
+        action="append",
+        dest="times",
+        metavar="HH:MM",
+        help="publication window in Moscow time",
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="refresh once and exit instead of waiting"
+    )
+    options = parser.parse_args(argv)
+
+    enable_response_cache(options.cache_dir)
+    jobs = DEFAULT_JOBS
+    if options.jobs:
+        jobs = [PrefetchJob.parse(spec) for spec in options.jobs]
+    times = DEFAULT_TIMES
+    if options.times:
+        times = [time.fromisoformat(at) for at in options.times]
+    prefetcher = Prefetcher(jobs, times)
+    if options.once:
+        failed = [(job, e) for job, e in prefetcher.run_once() if e is not None]
+        for job, e in failed:
+            print(f"{job.func}: {e!r}")
+        return 1 if failed else 0
+    try:
+        prefetcher.run_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,143 @@
+import cProfile
+import io
+import pstats
+import sys
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Optional, TextIO
+
+
+FRAME_GROUPS = ("cbrapi", "pandas", "suds", "lxml")
+
+
+def _frame_group(filename: str, funcname: str = "") -> str:
+    """
+    Assign a profiled frame to one of the library groups.
+    """
+    path = filename.replace("\\", "/")
+    for group in FRAME_GROUPS:
+        if f"/{group}/" in path:
+            return group
+    # C-level functions have no file name, but their repr names the extension module
+    for group in FRAME_GROUPS:
+        if f"{group}." in funcname:
+            return group
+    return "other"
+
+
+class ProfileReport:
+    """
+    Results of a profiled block: cProfile statistics and a tracemalloc snapshot.
+    """
+
+    def __init__(self):
+        self.stats: Optional[pstats.Stats] = None
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def top_functions(self, limit: int = 10) -> dict:
+        """
+        Top functions by cumulative time for each frame group.
+
+        Returns a dict {group: [(cumtime, ncalls, "file:line(func)"), ...]}.
+        """
+        groups = defaultdict(list)
+        for (filename, lineno, funcname), (_, ncalls, _, cumtime, _) in (
+            self.stats.stats.items()
+        ):
+            group = _frame_group(filename, funcname)
+            groups[group].append((cumtime, ncalls, f"{filename}:{lineno}({funcname})"))
+        return {
+            group: sorted(rows, reverse=True)[:limit] for group, rows in groups.items()
+        }
+
+    def top_allocations(self, limit: int = 10) -> dict:
+        """
+        Top allocation sites by size for each frame group.
+
+        Returns a dict {group: (total_bytes, [(size, count, "file:line"), ...])}.
+        """
+        groups = defaultdict(list)
+        for stat in self.snapshot.statistics("lineno"):
+            frame = stat.traceback[0]
+            group = _frame_group(frame.filename)
+            groups[group].append(
+                (stat.size, stat.count, f"{frame.filename}:{frame.lineno}")
+            )
+        return {
+            group: (sum(row[0] for row in rows), sorted(rows, reverse=True)[:limit])
+            for group, rows in groups.items()
+        }
+
+    def format(self, limit: int = 10) -> str:
+        """
+        Render the report as text.
+        """
+        out = io.StringIO()
+        out.write("=== CPU: top functions by cumulative time ===\n")
+        for group, rows in sorted(self.top_functions(limit).items()):
+            out.write(f"[{group}]\n")
+            for cumtime, ncalls, where in rows:
+                out.write(f"  {cumtime:10.4f}s {ncalls:>8} calls  {where}\n")
+        out.write("=== Memory: top allocation sites ===\n")
+        allocations = self.top_allocations(limit)
+        for group, (total, rows) in sorted(
+            allocations.items(), key=lambda item: item[1][0], reverse=True
+        ):
+            out.write(f"[{group}] total {total / 1024:.1f} KiB\n")
+            for size, count, where in rows:
+                out.write(f"  {size / 1024:10.1f} KiB {count:>8} blocks  {where}\n")
+        return out.getvalue()
+
+
+@contextmanager
+def profile(limit: int = 10, stream: Optional[TextIO] = sys.stderr):
+    """
+    Run a block of code under cProfile and tracemalloc.
+
+    Parameters
+    ----------
+    limit : int, default 10
+        Number of functions and allocation sites to show for each frame group.
+
+    stream : file-like, optional
+        Where to write the report on exit. Defaults to sys.stderr.
+        Pass None to skip writing and inspect the yielded report instead.
+
+    Yields
+    ------
+    ProfileReport
+        Filled with cProfile statistics and a tracemalloc snapshot when the block exits.
+
+    Notes
+    -----
+    Frames are grouped by origin: cbrapi, pandas, suds, lxml and other.
+    If tracemalloc is already tracing, it is left running on exit.
+
+    Examples
+    --------
+    >>> with cbrapi.profile():
+    ...     get_metals_prices()
+    """
+    report = ProfileReport()
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield report
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        if started_tracing:
+            tracemalloc.stop()
+        report.snapshot = snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+        report.stats = pstats.Stats(profiler)
+        if stream is not None:
+            stream.write(report.format(limit))
@@ -1,17 +1,17 @@
-from datetime import date
 from typing import Optional
 
 import pandas as pd
 
-from cbrapi.cbr_settings import make_cbr_client
-from cbrapi.helpers import normalize_data, guess_date
-
-
-today = date.today()
+from cbrapi.endpoints import fetch_endpoint
 
 
 def get_key_rate(
-    first_date: Optional[str] = None, last_date: Optional[str] = None, period: str = "D"
+    first_date: Optional[str] = None,
+    last_date: Optional[str] = None,
+    period: str = "D",
+    output: str = "pandas",
+    as_of=None,
+    days: str = "calendar",
 ) -> pd.Series:
     """
     Get the key rate time series from CBR.
@@ -29,6 +29,20 @@ def get_key_rate(
     period: {'D', 'M'}, default 'D'
         Data periodicity. Currently daily ('D') and monthly ('M') frequencies are supported.
 
+    output : {'pandas', 'numpy', 'arrow', 'polars'}, default 'pandas'
+        Result type. 'numpy' returns a (dates, values) pair of arrays, where dates are
+        int64 day ordinals since 1970-01-01 (month ordinals for monthly data).
+        'arrow' returns a pyarrow.Table with a 'date' column.
+        Both skip building the pandas index and pad the raw arrays.
+        'polars' returns a polars.DataFrame with a 'date' column.
+
+    as_of : str or datetime, optional
+        Return the values known at this time from the vintage store instead of
+        requesting CBR. Requires enable_vintage_store().
+
+    days : {'calendar', 'business'}, default 'calendar'
+        Pad daily data to every calendar day or to weekdays only (about 30% fewer rows).
+
     Returns
     -------
     pd.Series
@@ -46,26 +60,19 @@ def get_key_rate(
     >>> get_key_rate('2023-01-01', '2023-12-31')
     >>> get_key_rate(period='D')
     """
-    cbr_client = make_cbr_client()
-    data1 = guess_date(first_date, default_value="2013-09-13")
-    data2 = guess_date(last_date, default_value=str(today))
-    key_rate_xml = cbr_client.service.KeyRate(data1, data2)
-
-    try:
-        df = pd.read_xml(key_rate_xml, xpath=".//KR")
-    except ValueError:
-        return pd.Series()
-
-    level_1_column_mapping = {"Rate": "KEY_RATE"}
-
-    df = normalize_data(
-        data=df, period=period, symbol="KEY_RATE", level_1=level_1_column_mapping
+    return fetch_endpoint(
+        "KEY_RATE", first_date, last_date, period, output, as_of=as_of, days=days
     )
-    return df
 
 
 def get_ibor(
-    first_date: Optional[str] = None, last_date: Optional[str] = None, period: str = "M"
+    first_date: Optional[str] = None,
+    last_date: Optional[str] = None,
+    period: str = "M",
+    output: str = "pandas",
+    layout: str = "wide",
+    as_of=None,
+    days: str = "calendar",
 ) -> pd.DataFrame:
     """
     Get Interbank Offered Rate and related interbank rates from CBR.
@@ -83,6 +90,26 @@ def get_ibor(
     period : {'M'}, default 'M'
         Data periodicity. Currently only monthly ('M') frequency is supported.
 
+    output : {'pandas', 'numpy', 'arrow', 'polars'}, default 'pandas'
+        Result type. 'numpy' returns a (dates, values) pair of arrays, where dates are
+        int64 day ordinals since 1970-01-01 (month ordinals for monthly data).
+        'arrow' returns a pyarrow.Table with a 'date' column.
+        Both skip building the pandas index and pad the raw arrays.
+        'polars' returns a polars.DataFrame with a 'date' column.
+
+    layout : {'wide', 'long'}, default 'wide'
+        'long' returns a tidy DataFrame with 'date', 'series_id', 'tenor' and 'value'
+        columns instead of the wide MultiIndex table. series_id and tenor are
+        categoricals, and only observed values are kept. Use long_to_wide
+        to build the wide table later. Requires output='pandas'.
+
+    as_of : str or datetime, optional
+        Return the values known at this time from the vintage store instead of
+        requesting CBR. Requires enable_vintage_store().
+
+    days : {'calendar', 'business'}, default 'calendar'
+        Pad daily data to every calendar day or to weekdays only (about 30% fewer rows).
+
     Returns
     -------
     pd.DataFrame
@@ -123,41 +150,122 @@ def get_ibor(
     >>> get_ibor('2023-01-01', '2023-12-31')
     >>> get_ibor(period='M')
     """
-    cbr_client = make_cbr_client()
-    data1 = guess_date(first_date, default_value="2013-09-13")
-    data2 = guess_date(last_date, default_value=str(today))
-    mkr_xml = cbr_client.service.MKR(data1, data2)
-    try:
-        df = pd.read_xml(mkr_xml, xpath=".//MKR")
-    except ValueError:
-        return pd.Series()
-
-    level_0_column_mapping = {"d1": "D1", "d7": "D7", "d30": "D30", "d90": "D90"}
-
-    level_1_column_mapping = {
-        "1": "MIBID_RUB",
-        "2": "MIBOR_RUB",
-        "3": "MIACR_RUB",
-        "4": "MIACR_IG_RUB",
-        "5": "MIACR_RUB_TURNOVER",
-        "6": "MIACR_IG_RUB_TURNOVER",
-        "7": "MIACR_B_RUB",
-        "8": "MIACR_B_RUB_TURNOVER",
-        "9": "MIBID_USD",
-        "10": "MIBOR_USD",
-        "11": "MIACR_USD",
-        "12": "MIACR_IG_USD",
-        "13": "MIACR_USD_TURNOVER",
-        "14": "MIACR_IG_USD_TURNOVER",
-        "15": "MIACR_B_USD",
-        "16": "MIACR_B_USD_TURNOVER",
-    }
-
-    df = normalize_data(
-        data=df,
-        period=period,
-        symbol="MKR",
-        level_0=level_0_column_mapping,
-        level_1=level_1_column_mapping,
+    return fetch_endpoint(
+        "IBOR", first_date, last_date, period, output, layout, as_of, days=days
+    )
+
+
+def get_deposit_rates(
+    first_date: Optional[str] = None,
+    last_date: Optional[str] = None,
+    period: str = "D",
+    output: str = "pandas",
+    as_of=None,
+    days: str = "calendar",
+) -> pd.Series:
+    """
+    Get the Bank of Russia overnight deposit rate time series.
+
+    Parameters
+    ----------
+    first_date : str, optional
+        Start date in format 'YYYY-MM-DD'. If not specified, defaults to
+        '2010-01-01'.
+
+    last_date : str, optional
+        End date in format 'YYYY-MM-DD'. If not specified, defaults to
+        current date.
+
+    period: {'D', 'M'}, default 'D'
+        Data periodicity. Currently daily ('D') and monthly ('M') frequencies are supported.
+
+    output : {'pandas', 'numpy', 'arrow', 'polars'}, default 'pandas'
+        Result type. 'numpy' returns a (dates, values) pair of arrays, where dates are
+        int64 day ordinals since 1970-01-01 (month ordinals for monthly data).
+        'arrow' returns a pyarrow.Table with a 'date' column.
+        Both skip building the pandas index and pad the raw arrays.
+        'polars' returns a polars.DataFrame with a 'date' column.
+
+    as_of : str or datetime, optional
+        Return the values known at this time from the vintage store instead of
+        requesting CBR. Requires enable_vintage_store().
+
+    days : {'calendar', 'business'}, default 'calendar'
+        Pad daily data to every calendar day or to weekdays only (about 30% fewer rows).
+
+    Returns
+    -------
+    pd.Series
+        Time series of the overnight deposit rate with datetime index.
+        Rates are returned as decimals (e.g., 0.15 for 15%).
+
+    Notes
+    -----
+    Data of the DailyInfo DepoDynamic operation.
+
+    Examples
+    --------
+    >>> get_deposit_rates('2023-01-01', '2023-12-31')
+    """
+    return fetch_endpoint(
+        "DEPOSIT_RATES", first_date, last_date, period, output, as_of=as_of, days=days
+    )
+
+
+def get_repo_debt(
+    first_date: Optional[str] = None,
+    last_date: Optional[str] = None,
+    period: str = "D",
+    output: str = "pandas",
+    as_of=None,
+    days: str = "calendar",
+) -> pd.DataFrame:
+    """
+    Get credit institutions' debt on Bank of Russia repo operations.
+
+    Parameters
+    ----------
+    first_date : str, optional
+        Start date in format 'YYYY-MM-DD'. If not specified, defaults to
+        '2010-01-01'.
+
+    last_date : str, optional
+        End date in format 'YYYY-MM-DD'. If not specified, defaults to
+        current date.
+
+    period: {'D', 'M'}, default 'D'
+        Data periodicity. Currently daily ('D') and monthly ('M') frequencies are supported.
+
+    output : {'pandas', 'numpy', 'arrow', 'polars'}, default 'pandas'
+        Result type. 'numpy' returns a (dates, values) pair of arrays, where dates are
+        int64 day ordinals since 1970-01-01 (month ordinals for monthly data).
+        'arrow' returns a pyarrow.Table with a 'date' column.
+        Both skip building the pandas index and pad the raw arrays.
+        'polars' returns a polars.DataFrame with a 'date' column.
+
+    as_of : str or datetime, optional
+        Return the values known at this time from the vintage store instead of
+        requesting CBR. Requires enable_vintage_store().
+
+    days : {'calendar', 'business'}, default 'calendar'
+        Pad daily data to every calendar day or to weekdays only (about 30% fewer rows).
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with datetime index and the following columns:
+        - REPO_DEBT : Total debt on repo operations (RUB million)
+        - REPO_DEBT_AUCTION : Debt on auction repo operations (RUB million)
+        - REPO_DEBT_FIXED_RATE : Debt on fixed rate repo operations (RUB million)
+
+    Notes
+    -----
+    Data of the DailyInfo Repo_debt operation.
+
+    Examples
+    --------
+    >>> get_repo_debt('2023-01-01', '2023-12-31')
+    """
+    return fetch_endpoint(
+        "REPO_DEBT", first_date, last_date, period, output, as_of=as_of, days=days
     )
-    return df
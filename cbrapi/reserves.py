@@ -1,17 +1,17 @@
-from datetime import date
 from typing import Optional
 
 import pandas as pd
 
-from cbrapi.cbr_settings import make_cbr_client
-from cbrapi.helpers import normalize_data, guess_date
-
-
-today = date.today()
+from cbrapi.endpoints import fetch_endpoint
 
 
 def get_mrrf(
-    first_date: Optional[str] = None, last_date: Optional[str] = None, period: str = "M"
+    first_date: Optional[str] = None,
+    last_date: Optional[str] = None,
+    period: str = "M",
+    output: str = "pandas",
+    as_of=None,
+    days: str = "calendar",
 ) -> pd.DataFrame:
     """
     Get International Reserves and Foreign Currency Liquidity data from CBR.
@@ -29,6 +29,20 @@ def get_mrrf(
     period : {'M'}, default 'M'
         Data periodicity. Currently only monthly ('M') frequency is supported.
 
+    output : {'pandas', 'numpy', 'arrow', 'polars'}, default 'pandas'
+        Result type. 'numpy' returns a (dates, values) pair of arrays, where dates are
+        int64 day ordinals since 1970-01-01 (month ordinals for monthly data).
+        'arrow' returns a pyarrow.Table with a 'date' column.
+        Both skip building the pandas index and pad the raw arrays.
+        'polars' returns a polars.DataFrame with a 'date' column.
+
+    as_of : str or datetime, optional
+        Return the values known at this time from the vintage store instead of
+        requesting CBR. Requires enable_vintage_store().
+
+    days : {'calendar', 'business'}, default 'calendar'
+        Pad daily data to every calendar day or to weekdays only (about 30% fewer rows).
+
     Returns
     -------
     pd.DataFrame
@@ -55,27 +69,6 @@ def get_mrrf(
     >>> get_mrrf('2020-01-01', '2023-12-31')
     >>> get_mrrf(period='M')
     """
-    cbr_client = make_cbr_client()
-    data1 = guess_date(first_date, default_value="1999-01-01")
-    data2 = guess_date(last_date, default_value=str(today))
-    mrrf_xml = cbr_client.service.mrrf(data1, data2)
-
-    try:
-        df = pd.read_xml(mrrf_xml, xpath=".//mr")
-    except ValueError:
-        return pd.Series()
-
-    level_1_column_mapping = {
-        "p1": "TOTAL_RESERVES",
-        "p2": "CURRENCY_RESERVES",
-        "p3": "FOREIGN_CURRENCY",
-        "p4": "SDR_ACCOUNT",
-        "p5": "IMF_RESERVE",
-        "p6": "MONETARY_GOLD",
-    }
-
-    df = normalize_data(
-        data=df, period=period, symbol="mr", level_1=level_1_column_mapping
+    return fetch_endpoint(
+        "MRRF", first_date, last_date, period, output, as_of=as_of, days=days
     )
-
-    return df
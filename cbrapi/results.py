@@ -0,0 +1,246 @@
+import functools
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from cbrapi.cache import is_refreshing
+
+
+_result_cache = None
+
+
+def sizeof(value) -> int:
+    """
+    Estimate the memory used by a get_* result in bytes.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, tuple):
+        return sum(sizeof(item) for item in value)
+    if hasattr(value, "estimated_size"):  # polars.DataFrame
+        return value.estimated_size()
+    if hasattr(value, "nbytes"):  # pyarrow.Table
+        return value.nbytes
+    return sys.getsizeof(value)
+
+
+def _freeze(value):
+    """
+    Make a stored result read-only where the type allows it.
+    """
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, tuple):
+        for item in value:
+            _freeze(item)
+    return value
+
+
+def _protect(value):
+    """
+    Return a stored result in a form the caller cannot use to change it.
+
+    With pandas copy-on-write a shallow copy is enough, otherwise (including the
+    'warn' mode of pandas 2.x) pandas objects are copied. numpy arrays are returned as read-only views; arrow and polars
+    tables are immutable.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=pd.options.mode.copy_on_write is not True)
+    if isinstance(value, np.ndarray):
+        return value.view()
+    if isinstance(value, tuple):
+        return tuple(_protect(item) for item in value)
+    return value
+
+
+class ResultCache:
+    """
+    In-memory LRU cache of get_* results limited by their memory usage.
+
+    Parameters
+    ----------
+    max_bytes : int, default 256 MiB
+        Memory budget. Least recently used results are evicted first.
+        Results larger than the budget are not cached.
+
+    ttl : float, optional
+        Seconds to keep a result. Results are also keyed by the current date,
+        so they are never reused on the next day.
+    """
+
+    def __init__(
+        self, max_bytes: int = 256 * 1024 * 1024, ttl: Optional[float] = 3600
+    ):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (created, size, value)
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def _pop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key):
+        """
+        Return a protected copy of a cached result or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None:
+                if time.monotonic() - entry[0] > self.ttl:
+                    self._pop(key)
+                    entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+        return _protect(entry[2])
+
+    def put(self, key, value):
+        """
+        Store a result and evict least recently used ones to stay within max_bytes.
+        """
+        size = sizeof(value)
+        if size > self.max_bytes:
+            return
+        _freeze(value)
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (time.monotonic(), size, value)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+                self._evictions += 1
+
+    def get_or_call(self, key, func: Callable):
+        """
+        Return a cached result or call func() and cache its result.
+        """
+        value = self.get(key)
+        if value is None:
+            value = func()
+            self.put(key, value)
+            value = _protect(value)
+        return value
+
+    def stats(self) -> dict:
+        """
+        Return hits, misses, evictions, number of entries and bytes in use.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self):
+        """
+        Remove all results. Statistics are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+def cached_result(func: Callable) -> Callable:
+    """
+    Serve results of a get_* function from the result cache if it is enabled.
+
+    Inside refresh_responses() the function is always called and its result replaces
+    the cached one.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _result_cache
+        if cache is None:
+            return func(*args, **kwargs)
+        key = (
+            func.__module__,
+            func.__qualname__,
+            args,
+            tuple(sorted(kwargs.items())),
+            date.today(),
+        )
+        try:
+            hash(key)
+        except TypeError:  # e.g. an Endpoint with a dict field
+            return func(*args, **kwargs)
+        if is_refreshing():
+            value = func(*args, **kwargs)
+            cache.put(key, value)
+            return _protect(value)
+        return cache.get_or_call(key, lambda: func(*args, **kwargs))
+
+    return wrapper
+
+
+def enable_result_cache(
+    max_bytes: int = 256 * 1024 * 1024, ttl: Optional[float] = 3600
+) -> ResultCache:
+    """
+    Keep results of get_* functions in memory within a byte budget.
+
+    Parameters
+    ----------
+    max_bytes : int, default 256 MiB
+        Memory budget measured with memory_usage(deep=True) for pandas objects.
+        Least recently used results are evicted first.
+
+    ttl : float, optional, default 3600
+        Seconds to keep a result. If None, results are kept until the end of the day.
+
+    Returns
+    -------
+    ResultCache
+        The cache in use. Call its stats() method for hits, misses and evictions.
+
+    Notes
+    -----
+    Callers get copies (shallow ones if pandas copy-on-write is enabled) or read-only
+    arrays, so changing a result does not change the cached one.
+
+    Examples
+    --------
+    >>> cache = enable_result_cache(max_bytes=64 * 1024 * 1024)
+    >>> get_metals_prices()
+    >>> cache.stats()
+    """
+    global _result_cache
+    _result_cache = ResultCache(max_bytes, ttl)
+    return _result_cache
+
+
+def disable_result_cache():
+    """
+    Stop caching results of get_* functions and free the memory.
+    """
+    global _result_cache
+    _result_cache = None
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """
+    Return the result cache in use or None if it is disabled.
+    """
+    return _result_cache
@@ -1,13 +1,9 @@
-from datetime import date
 from typing import Optional
 
 import pandas as pd
 
-from cbrapi.cbr_settings import make_cbr_client
-from cbrapi.helpers import normalize_data, guess_date
-
-
-today = date.today()
+from cbrapi.endpoints import fetch_endpoint
+from cbrapi.helpers import normalize_data, check_output
 
 
 def get_ruonia_ts(
@@ -15,6 +11,9 @@ def get_ruonia_ts(
     first_date: Optional[str] = None,
     last_date: Optional[str] = None,
     period: str = "D",
+    output: str = "pandas",
+    as_of=None,
+    days: str = "calendar",
 ) -> pd.Series:
     """
     Get RUONIA (Ruble Overnight Index Average) time series data from CBR.
@@ -40,6 +39,20 @@ def get_ruonia_ts(
     period: {'D', 'M'}, default 'D'
         Data periodicity. Currently daily ('D') and monthly ('M') frequencies are supported.
 
+    output : {'pandas', 'numpy', 'arrow', 'polars'}, default 'pandas'
+        Result type. 'numpy' returns a (dates, values) pair of arrays, where dates are
+        int64 day ordinals since 1970-01-01 (month ordinals for monthly data).
+        'arrow' returns a pyarrow.Table with a 'date' column.
+        Both skip building the pandas index and pad the raw arrays.
+        'polars' returns a polars.DataFrame with a 'date' column.
+
+    as_of : str or datetime, optional
+        Return the values known at this time from the vintage store instead of
+        requesting CBR. Requires enable_vintage_store().
+
+    days : {'calendar', 'business'}, default 'calendar'
+        Pad daily data to every calendar day or to weekdays only (about 30% fewer rows).
+
     Returns
     -------
     pd.Series
@@ -56,6 +69,7 @@ def get_ruonia_ts(
     >>> get_ruonia_ts('RUONIA.INDX', '2023-01-01', '2023-12-31')
     >>> get_ruonia_ts('RUONIA_AVG_3M.RATE')
     """
+    check_output(output)
     if symbol in [
         "RUONIA.INDX",
         "RUONIA_AVG_1M.RATE",
@@ -65,16 +79,24 @@ def get_ruonia_ts(
         ticker = (
             symbol.split(".")[0] if symbol.split(".")[1] == "RATE" else "RUONIA_INDEX"
         )
-        df = get_ruonia_index(first_date, last_date).loc[:, ticker]
+        df = get_ruonia_index(first_date, last_date, as_of=as_of, days=days)
+        df = df.loc[:, ticker]
         if symbol != "RUONIA.INDX":
             df /= 100
-        return normalize_data(df, period, symbol)
+        return normalize_data(df, period, symbol, output=output, days=days)
     else:
-        return get_ruonia_overnight(first_date, last_date, period)
+        return get_ruonia_overnight(
+            first_date, last_date, period, output, as_of=as_of, days=days
+        )
 
 
 def get_ruonia_index(
-    first_date: Optional[str] = None, last_date: Optional[str] = None, period: str = "D"
+    first_date: Optional[str] = None,
+    last_date: Optional[str] = None,
+    period: str = "D",
+    output: str = "pandas",
+    as_of=None,
+    days: str = "calendar",
 ) -> pd.DataFrame:
     """
     Get RUONIA index and averages time series from CBR.
@@ -92,6 +114,20 @@ def get_ruonia_index(
     period: {'D', 'M'}, default 'D'
         Data periodicity. Currently daily ('D') and monthly ('M') frequencies are supported.
 
+    output : {'pandas', 'numpy', 'arrow', 'polars'}, default 'pandas'
+        Result type. 'numpy' returns a (dates, values) pair of arrays, where dates are
+        int64 day ordinals since 1970-01-01 (month ordinals for monthly data).
+        'arrow' returns a pyarrow.Table with a 'date' column.
+        Both skip building the pandas index and pad the raw arrays.
+        'polars' returns a polars.DataFrame with a 'date' column.
+
+    as_of : str or datetime, optional
+        Return the values known at this time from the vintage store instead of
+        requesting CBR. Requires enable_vintage_store().
+
+    days : {'calendar', 'business'}, default 'calendar'
+        Pad daily data to every calendar day or to weekdays only (about 30% fewer rows).
+
     Returns
     -------
     pd.DataFrame
@@ -112,31 +148,18 @@ def get_ruonia_index(
     >>> get_ruonia_index('2023-01-01', '2023-12-31')
     >>> get_ruonia_index(period='D')
     """
-    cbr_client = make_cbr_client()
-    data1 = guess_date(first_date, default_value="2010-01-01")
-    data2 = guess_date(last_date, default_value=str(today))
-    ruonia_index_xml = cbr_client.service.RuoniaSV(data1, data2)
-
-    try:
-        df = pd.read_xml(ruonia_index_xml, xpath=".//ra")
-    except ValueError:
-        return pd.Series()
-
-    level_1_column_mapping = {
-        "RUONIA_Index": "RUONIA_INDEX",
-        "R1W": "RUONIA_AVG_1M",
-        "R2W": "RUONIA_AVG_3M",
-        "R1M": "RUONIA_AVG_6M",
-    }
-
-    df = normalize_data(
-        data=df, period=period, symbol="ra", level_1=level_1_column_mapping
+    return fetch_endpoint(
+        "RUONIA_INDEX", first_date, last_date, period, output, as_of=as_of, days=days
     )
-    return df
 
 
 def get_ruonia_overnight(
-    first_date: Optional[str] = None, last_date: Optional[str] = None, period: str = "D"
+    first_date: Optional[str] = None,
+    last_date: Optional[str] = None,
+    period: str = "D",
+    output: str = "pandas",
+    as_of=None,
+    days: str = "calendar",
 ) -> pd.Series:
     """
     Get RUONIA overnight value time series from CBR.
@@ -154,6 +177,20 @@ def get_ruonia_overnight(
     period: {'D', 'M'}, default 'D'
         Data periodicity. Currently daily ('D') and monthly ('M') frequencies are supported.
 
+    output : {'pandas', 'numpy', 'arrow', 'polars'}, default 'pandas'
+        Result type. 'numpy' returns a (dates, values) pair of arrays, where dates are
+        int64 day ordinals since 1970-01-01 (month ordinals for monthly data).
+        'arrow' returns a pyarrow.Table with a 'date' column.
+        Both skip building the pandas index and pad the raw arrays.
+        'polars' returns a polars.DataFrame with a 'date' column.
+
+    as_of : str or datetime, optional
+        Return the values known at this time from the vintage store instead of
+        requesting CBR. Requires enable_vintage_store().
+
+    days : {'calendar', 'business'}, default 'calendar'
+        Pad daily data to every calendar day or to weekdays only (about 30% fewer rows).
+
     Returns
     -------
     pd.Series
@@ -171,29 +208,24 @@ def get_ruonia_overnight(
     >>> get_ruonia_overnight('2023-01-01', '2023-12-31')
     >>> get_ruonia_overnight(period='D')
     """
-    cbr_client = make_cbr_client()
-    data1 = guess_date(first_date, default_value="2010-01-01")
-    data2 = guess_date(last_date, default_value=str(date.today()))
-    ruonia_overnight_xml = cbr_client.service.Ruonia(data1, data2)
-
-    try:
-        df = pd.read_xml(ruonia_overnight_xml, xpath="//ro")
-    except ValueError:
-        return pd.Series()
-
-    level_1_column_mapping = {
-        "ruo": "RUONIA_OVERNIGHT",
-    }
-
-    df = normalize_data(
-        data=df, period=period, symbol="ro", level_1=level_1_column_mapping
+    return fetch_endpoint(
+        "RUONIA_OVERNIGHT",
+        first_date,
+        last_date,
+        period,
+        output,
+        as_of=as_of,
+        days=days,
     )
-    df /= 100
-    return df
 
 
 def get_roisfix(
-    first_date: Optional[str] = None, last_date: Optional[str] = None, period: str = "D"
+    first_date: Optional[str] = None,
+    last_date: Optional[str] = None,
+    period: str = "D",
+    output: str = "pandas",
+    as_of=None,
+    days: str = "calendar",
 ) -> pd.DataFrame:
     """
     Get ROISfix (Ruble Overnight Index Swap Fixing) time series from CBR.
@@ -211,6 +243,20 @@ def get_roisfix(
     period: {'D', 'M'}, default 'D'
         Data periodicity. Currently daily ('D') and monthly ('M') frequencies are supported.
 
+    output : {'pandas', 'numpy', 'arrow', 'polars'}, default 'pandas'
+        Result type. 'numpy' returns a (dates, values) pair of arrays, where dates are
+        int64 day ordinals since 1970-01-01 (month ordinals for monthly data).
+        'arrow' returns a pyarrow.Table with a 'date' column.
+        Both skip building the pandas index and pad the raw arrays.
+        'polars' returns a polars.DataFrame with a 'date' column.
+
+    as_of : str or datetime, optional
+        Return the values known at this time from the vintage store instead of
+        requesting CBR. Requires enable_vintage_store().
+
+    days : {'calendar', 'business'}, default 'calendar'
+        Pad daily data to every calendar day or to weekdays only (about 30% fewer rows).
+
     Returns
     -------
     pd.DataFrame
@@ -231,26 +277,6 @@ def get_roisfix(
     >>> get_roisfix('2023-01-01', '2023-12-31')
     >>> get_roisfix(period='D')
     """
-    cbr_client = make_cbr_client()
-    data1 = guess_date(first_date, default_value="2011-04-15")
-    data2 = guess_date(last_date, default_value=str(today))
-    roisfix_xml = cbr_client.service.ROISfix(data1, data2)
-
-    try:
-        df = pd.read_xml(roisfix_xml, xpath=".//rf")
-    except ValueError:
-        return pd.Series()
-
-    level_1_column_mapping = {
-        "R1W": "RATE_1_WEEK",
-        "R2W": "RATE_2_WEEK",
-        "R1M": "RATE_1_MONTH",
-        "R2M": "RATE_2_MONTH",
-        "R3M": "RATE_3_MONTH",
-        "R6M": "RATE_6_MONTH",
-    }
-
-    df = normalize_data(
-        data=df, period=period, symbol="rf", level_1=level_1_column_mapping
+    return fetch_endpoint(
+        "ROISFIX", first_date, last_date, period, output, as_of=as_of, days=days
     )
-    return df
@@ -0,0 +1,170 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+
+_stale_while_revalidate = None
+
+
+class StaleWhileRevalidate:
+    """
+    In-memory store of CBR replies served with the stale-while-revalidate policy.
+
+    A reply younger than max_age is returned as is. A reply older than max_age
+    but younger than max_staleness is returned immediately while a background
+    thread fetches a new one. Older replies are refetched synchronously.
+    """
+
+    def __init__(
+        self,
+        max_age: float = 60,
+        max_staleness: float = 3600,
+        serve_stale_on_error: bool = True,
+        timeout: Optional[float] = None,
+        max_entries: int = 1024,
+        max_workers: int = 4,
+    ):
+        if max_staleness < max_age:
+            raise ValueError("max_staleness should not be less than max_age.")
+        self.max_age = max_age
+        self.max_staleness = max_staleness
+        self.serve_stale_on_error = serve_stale_on_error
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (fetched_at, reply)
+        self._in_flight = {}  # key -> Future
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cbrapi-revalidate"
+        )
+
+    def _store(self, key: str, reply):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), reply)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _run(self, key: str, fetch: Callable):
+        try:
+            reply = fetch()
+            self._store(key, reply)
+            return reply
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def revalidate(self, key: str, fetch: Callable) -> Future:
+        """
+        Fetch a new reply in the background. Concurrent calls for one key share a request.
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is None:
+                future = self._executor.submit(self._run, key, fetch)
+                self._in_flight[key] = future
+        return future
+
+    def get(self, key: str, fetch: Callable, refresh: Optional[Callable] = None):
+        """
+        Return a reply for the key, calling fetch() to get it when needed.
+
+        refresh() replaces fetch() once the key has a reply, so a revalidation
+        can bypass lower cache layers that would return the same reply.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None:
+            fetch = refresh or fetch
+            fetched_at, reply = entry
+            age = time.monotonic() - fetched_at
+            if age <= self.max_age:
+                return reply
+            if age <= self.max_staleness:
+                self.revalidate(key, fetch)
+                return reply
+
+        can_serve_stale = entry is not None and self.serve_stale_on_error
+        future = self.revalidate(key, fetch)
+        try:
+            return future.result(timeout=self.timeout if can_serve_stale else None)
+        except Exception:  # includes concurrent.futures.TimeoutError
+            if can_serve_stale:
+                return entry[1]
+            raise
+
+    def clear(self):
+        """
+        Remove all stored replies.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+def enable_stale_while_revalidate(
+    max_age: float = 60,
+    max_staleness: float = 3600,
+    serve_stale_on_error: bool = True,
+    timeout: Optional[float] = None,
+    max_entries: int = 1024,
+    max_workers: int = 4,
+) -> StaleWhileRevalidate:
+    """
+    Serve CBR replies from memory while refreshing them in the background.
+
+    Parameters
+    ----------
+    max_age : float, default 60
+        Seconds during which a reply is served without refreshing.
+
+    max_staleness : float, default 3600
+        Seconds during which a reply is still served immediately while a refresh
+        runs in the background. Older replies are refreshed synchronously.
+
+    serve_stale_on_error : bool, default True
+        Return the last known reply if a synchronous refresh fails or times out.
+
+    timeout : float, optional
+        Seconds to wait for a synchronous refresh before serving the last known reply.
+        Only applies if serve_stale_on_error is True and a reply is known.
+
+    max_entries : int, default 1024
+        Number of replies kept in memory. Least recently used replies are dropped first.
+
+    max_workers : int, default 4
+        Number of background refresh threads.
+
+    Returns
+    -------
+    StaleWhileRevalidate
+        The store in use.
+
+    Examples
+    --------
+    >>> enable_stale_while_revalidate(max_age=300, max_staleness=86400, timeout=2)
+    >>> get_key_rate()
+    """
+    global _stale_while_revalidate
+    _stale_while_revalidate = StaleWhileRevalidate(
+        max_age, max_staleness, serve_stale_on_error, timeout, max_entries, max_workers
+    )
+    return _stale_while_revalidate
+
+
+def disable_stale_while_revalidate():
+    """
+    Stop serving CBR replies from the stale-while-revalidate store.
+    """
+    global _stale_while_revalidate
+    _stale_while_revalidate = None
+
+
+def get_stale_while_revalidate() -> Optional[StaleWhileRevalidate]:
+    """
+    Return the stale-while-revalidate store in use or None if it is disabled.
+    """
+    return _stale_while_revalidate
@@ -0,0 +1,158 @@
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Union
+
+import pandas as pd
+
+from cbrapi.results import _protect
+
+
+FREQUENCIES = {"D": "D", "W": "W", "M": "M", "Q": "Q", "Y": "Y", "A": "Y"}
+
+AGGREGATIONS = ("last", "first", "mean", "min", "max", "ohlc")
+
+MAX_SERIES = 32
+
+_series_views = OrderedDict()
+_lock = threading.Lock()
+
+
+def _frequency(freq: str) -> str:
+    if freq.upper() not in FREQUENCIES:
+        raise ValueError(f"freq should be one of {tuple(FREQUENCIES)}.")
+    return FREQUENCIES[freq.upper()]
+
+
+class SeriesViews:
+    """
+    Daily time series with lazily built and memoized lower frequency views.
+
+    Parameters
+    ----------
+    daily : pd.Series or pd.DataFrame
+        Daily data with a PeriodIndex, as returned by get_* functions with period='D'.
+
+    Notes
+    -----
+    Views are returned as copies, like results of the result cache, so changing
+    one does not change the memoized view or the daily data. Views of empty daily
+    data are empty.
+    """
+
+    def __init__(self, daily: Union[pd.Series, pd.DataFrame]):
+        self.daily = daily
+        self._views = {}
+        self._lock = threading.RLock()
+
+    def _memoize(self, key: tuple, build: Callable):
+        with self._lock:
+            if key not in self._views:
+                self._views[key] = build()
+            return self._views[key]
+
+    def _view(self, freq: str, how: str):
+        if freq == "D":
+            return self.daily
+        if self.daily.empty:  # a reply without rows has no PeriodIndex
+            if how == "ohlc" or isinstance(self.daily, pd.DataFrame):
+                return pd.DataFrame(dtype=float)
+            return pd.Series(dtype=float)
+        return self._memoize(
+            ("view", freq, how),
+            lambda: getattr(self.daily.groupby(self.daily.index.asfreq(freq)), how)(),
+        )
+
+    def view(
+        self, freq: str = "M", how: str = "last"
+    ) -> Union[pd.Series, pd.DataFrame]:
+        """
+        Aggregate the daily data to a lower frequency.
+
+        Parameters
+        ----------
+        freq : {'D', 'W', 'M', 'Q', 'Y'}, default 'M'
+            Target frequency. 'A' is an alias for 'Y'.
+
+        how : {'last', 'first', 'mean', 'min', 'max', 'ohlc'}, default 'last'
+            Aggregation within each period.
+
+        Returns
+        -------
+        pd.Series or pd.DataFrame
+            Data with a PeriodIndex of the target frequency.
+        """
+        freq = _frequency(freq)
+        if how not in AGGREGATIONS:
+            raise ValueError(f"how should be one of {AGGREGATIONS}.")
+        return _protect(self._view(freq, how))
+
+    def ohlc(self, freq: str = "M") -> pd.DataFrame:
+        """
+        Open, high, low and close values of each period.
+        """
+        return self.view(freq, "ohlc")
+
+    def returns(self, freq: str = "M") -> Union[pd.Series, pd.DataFrame]:
+        """
+        Period returns of the last values of each period.
+        """
+        freq = _frequency(freq)
+        returns = self._memoize(
+            ("returns", freq),
+            lambda: self._view(freq, "last").pct_change(fill_method=None).iloc[1:],
+        )
+        return _protect(returns)
+
+
+def get_series_views(func: Callable, *args, **kwargs) -> SeriesViews:
+    """
+    Fetch daily data once and return an object deriving other frequencies from it.
+
+    Parameters
+    ----------
+    func : callable
+        A cbrapi get_* function with a period parameter (e.g., get_time_series).
+
+    *args, **kwargs
+        Arguments of func except period. Daily data is always requested.
+
+    Returns
+    -------
+    SeriesViews
+        Cached per function, arguments and current date, so repeated calls
+        with the same source and range do not fetch or resample again.
+
+    Examples
+    --------
+    >>> usd = get_series_views(get_time_series, 'USD', '2020-01-01', '2023-12-31')
+    >>> usd.view('M')
+    >>> usd.ohlc('Q')
+    >>> usd.returns('Y')
+    """
+    key = (
+        func.__module__,
+        func.__qualname__,
+        args,
+        tuple(sorted(kwargs.items())),
+        date.today(),
+    )
+    with _lock:
+        views = _series_views.get(key)
+        if views is not None:
+            _series_views.move_to_end(key)
+            return views
+    views = SeriesViews(func(*args, period="D", **kwargs))
+    with _lock:
+        views = _series_views.setdefault(key, views)
+        while len(_series_views) > MAX_SERIES:
+            _series_views.popitem(last=False)
+    return views
+
+
+def clear_series_views():
+    """
+    Drop all cached series and their views.
+    """
+    with _lock:
+        _series_views.clear()
@@ -0,0 +1,318 @@
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Union
+
+import pandas as pd
+
+
+DEFAULT_VINTAGE_PATH = (
+    Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share"))
+    / "cbrapi"
+    / "vintages.sqlite"
+)
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    name TEXT PRIMARY KEY,
+    freq TEXT,
+    is_frame INTEGER NOT NULL,
+    index_name TEXT,
+    columns TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS vintages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    series TEXT NOT NULL,
+    retrieved_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS vintages_by_time ON vintages (series, retrieved_at);
+CREATE TABLE IF NOT EXISTS observations (
+    series TEXT NOT NULL,
+    field TEXT NOT NULL,
+    date TEXT NOT NULL,
+    vintage INTEGER NOT NULL,
+    value REAL,
+    PRIMARY KEY (series, date, field, vintage)
+) WITHOUT ROWID;
+"""
+
+_vintage_store = None
+
+
+def _timestamp(value) -> str:
+    return pd.Timestamp(value).strftime(TIMESTAMP_FORMAT)
+
+
+def _column_key(column) -> str:
+    return json.dumps(list(column) if isinstance(column, tuple) else column)
+
+
+def _column_name(key: str):
+    column = json.loads(key)
+    return tuple(column) if isinstance(column, list) else column
+
+
+class VintageStore:
+    """
+    SQLite store of time series revisions.
+
+    Each recorded fetch becomes a vintage stamped with its retrieval time. Only the
+    observations that are new or differ from the previous vintage are written, so
+    a series costs one row per published value plus one row per revision.
+    Queries read the latest row at or before a vintage through the primary key.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        Database file. Defaults to '~/.local/share/cbrapi/vintages.sqlite'.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path or DEFAULT_VINTAGE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        with closing(self._connect()) as connection:
+            connection.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    @staticmethod
+    def _latest(connection, name: str, vintage: int, first=None, last=None) -> dict:
+        query = (
+            "SELECT field, date, value, MAX(vintage) FROM observations "
+            "WHERE series = ? AND vintage <= ?"
+        )
+        params = [name, vintage]
+        if first is not None:
+            query += " AND date >= ?"
+            params.append(first)
+        if last is not None:
+            query += " AND date <= ?"
+            params.append(last)
+        query += " GROUP BY date, field"
+        return {
+            (field, day): value
+            for field, day, value, _ in connection.execute(query, params)
+        }
+
+    def record(
+        self,
+        name: str,
+        data: Union[pd.Series, pd.DataFrame],
+        retrieved_at: Optional[datetime] = None,
+    ) -> int:
+        """
+        Store the values of a fetch that differ from the latest vintage.
+
+        Parameters
+        ----------
+        name : str
+            Series name (e.g., 'mrrf').
+
+        data : pd.Series or pd.DataFrame
+            Fetched data with a PeriodIndex or DatetimeIndex. Dates missing from data
+            are left as they are, so fetches of partial date ranges can be recorded.
+
+        retrieved_at : datetime, optional
+            Retrieval time. Defaults to now.
+
+        Returns
+        -------
+        int
+            Number of new or revised observations.
+        """
+        is_frame = isinstance(data, pd.DataFrame)
+        frame = data if is_frame else data.to_frame()
+        if frame.empty:
+            return 0
+        freq = frame.index.freqstr if isinstance(frame.index, pd.PeriodIndex) else None
+        dates = frame.index.astype(str)
+        columns = [_column_key(column) for column in frame.columns]
+        index_name = frame.index.name
+        values = frame.to_numpy(dtype=float)
+        stamp = _timestamp(retrieved_at or datetime.now())
+
+        with self._lock, closing(self._connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT columns FROM series WHERE name = ?", (name,)
+                ).fetchone()
+                known_columns = json.loads(row[0]) if row else []
+                all_columns = known_columns + [
+                    column for column in columns if column not in known_columns
+                ]
+                connection.execute(
+                    "INSERT OR REPLACE INTO series VALUES (?, ?, ?, ?, ?)",
+                    (name, freq, int(is_frame), index_name, json.dumps(all_columns)),
+                )
+                known = self._latest(connection, name, 2**62, min(dates), max(dates))
+                changes = [
+                    (column, day, value)
+                    for j, column in enumerate(columns)
+                    for day, value in zip(dates, values[:, j].tolist())
+                    if value == value and known.get((column, day)) != value
+                ]
+                if changes:
+                    vintage = connection.execute(
+                        "INSERT INTO vintages (series, retrieved_at) VALUES (?, ?)",
+                        (name, stamp),
+                    ).lastrowid
+                    connection.executemany(
+                        "INSERT INTO observations VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (name, column, day, vintage, value)
+                            for column, day, value in changes
+                        ],
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return len(changes)
+
+    def load(
+        self,
+        name: str,
+        as_of=None,
+        first_date: Optional[str] = None,
+        last_date: Optional[str] = None,
+    ) -> Union[pd.Series, pd.DataFrame]:
+        """
+        Return a series as it was known at a point in time.
+
+        Parameters
+        ----------
+        name : str
+            Series name used in record().
+
+        as_of : str or datetime, optional
+            Only vintages retrieved at or before this time are used. A date means
+            its midnight. Defaults to the latest vintage.
+
+        first_date, last_date : str or datetime, optional
+            Date range to return.
+
+        Returns
+        -------
+        pd.Series or pd.DataFrame
+            Data in the shape it was recorded, with float values.
+            Empty if nothing was known at as_of.
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT freq, is_frame, index_name, columns FROM series WHERE name = ?",
+                (name,),
+            ).fetchone()
+            if row is None:
+                raise ValueError(f"No vintages recorded for {name}.")
+            freq, is_frame, index_name, columns = row
+            if freq:
+                first_date = first_date and str(pd.Period(first_date, freq))
+                last_date = last_date and str(pd.Period(last_date, freq))
+            else:
+                first_date = first_date and str(pd.Timestamp(first_date).date())
+                last_date = last_date and str(pd.Timestamp(last_date).date())
+            if as_of is None:
+                vintage = 2**62
+            else:
+                (vintage,) = connection.execute(
+                    "SELECT MAX(id) FROM vintages "
+                    "WHERE series = ? AND retrieved_at <= ?",
+                    (name, _timestamp(as_of)),
+                ).fetchone()
+            observations = (
+                {}
+                if vintage is None
+                else self._latest(connection, name, vintage, first_date, last_date)
+            )
+
+        if not observations:
+            return pd.DataFrame() if is_frame else pd.Series(dtype=float)
+        long = pd.Series(
+            list(observations.values()),
+            index=pd.MultiIndex.from_tuples(
+                list(observations), names=["field", "date"]
+            ),
+            dtype=float,
+        )
+        frame = long.unstack("field")
+        frame.index = (
+            pd.PeriodIndex(frame.index, freq=freq)
+            if freq
+            else pd.DatetimeIndex(frame.index)
+        )
+        frame.index.name = index_name
+        frame = frame.sort_index()
+        frame = frame.reindex(columns=json.loads(columns))
+        names = [_column_name(key) for key in frame.columns]
+        if names and all(isinstance(column, tuple) for column in names):
+            frame.columns = pd.MultiIndex.from_tuples(names)
+        else:
+            frame.columns = names
+        return frame if is_frame else frame.iloc[:, 0]
+
+    def vintages(self, name: str) -> pd.DatetimeIndex:
+        """
+        Return retrieval times of the vintages of a series.
+        """
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT retrieved_at FROM vintages WHERE series = ? ORDER BY id",
+                (name,),
+            ).fetchall()
+        return pd.DatetimeIndex([stamp for (stamp,) in rows], name="retrieved_at")
+
+
+def enable_vintage_store(path: Union[str, Path, None] = None) -> VintageStore:
+    """
+    Record the observations fetched by the registry endpoints as vintages.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        Database file. Defaults to '~/.local/share/cbrapi/vintages.sqlite'.
+
+    Returns
+    -------
+    VintageStore
+        The store in use.
+
+    Notes
+    -----
+    Series are named after the DailyInfo operation (e.g., 'mrrf') and hold the
+    observations as published, before padding and monthly resampling. Pass as_of
+    to the get_* functions or fetch_endpoint to read the values known at that time
+    with any period and days. Results with output='polars' are not recorded.
+
+    Examples
+    --------
+    >>> enable_vintage_store()
+    >>> get_mrrf()
+    >>> get_mrrf(as_of='2024-03-01')
+    """
+    global _vintage_store
+    _vintage_store = VintageStore(path)
+    return _vintage_store
+
+
+def disable_vintage_store():
+    """
+    Stop recording vintages. The database is kept on disk.
+    """
+    global _vintage_store
+    _vintage_store = None
+
+
+def get_vintage_store() -> Optional[VintageStore]:
+    """
+    Return the vintage store in use or None if it is disabled.
+    """
+    return _vintage_store